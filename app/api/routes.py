@@ -3,11 +3,21 @@ from typing import Optional
 from pydantic import BaseModel
 from app.core import logger
 from app.core.config import config
+from app.core.station_context import StationLocal, current_station
 from app.managers.token_manager import TokenManager
 from app.services.api_service import Service
+from app.streaming.station_manager import station_manager
 
 router = APIRouter()
-service = Service()
+
+
+def create_station_service():
+    station_service = Service()
+    station_service.set_queue(station_manager.get_current().queue)
+    return station_service
+
+
+service = StationLocal(create_station_service)
 
 
 class AddSongRequest(BaseModel):
@@ -33,6 +43,7 @@ class DefaultPlaylistRequest(BaseModel):
     source: Optional[str] = "youtube"
     isActive: Optional[bool] = True
     genre: Optional[str] = "mix"
+    weight: Optional[int] = 1
 
 
 class UpdatePlaylistStatusRequest(BaseModel):
@@ -94,6 +105,14 @@ async def verify_admin(
     return True
 
 
+async def use_station(station_id: str):
+    if not station_manager.get(station_id):
+        raise HTTPException(status_code=404, detail=f"Station not found: {station_id}")
+    
+    current_station.set(station_id)
+    return station_id
+
+
 @router.post("/songs/add")
 async def add_song_to_queue(request: AddSongRequest):
     try:
@@ -174,9 +193,12 @@ async def seek_song(seconds: int):
 
 
 @router.get("/songs/previous", dependencies=[Depends(verify_token)])
-async def previous_song():
+async def previous_song(steps: int = 1):
     try:
-        response = await service.previous()
+        if steps < 1:
+            raise HTTPException(status_code=400, detail="Invalid number of steps")
+        
+        response = await service.previous(steps)
         return success_response(response, "Previous Song")
     
     except Exception as error:
@@ -184,6 +206,20 @@ async def previous_song():
         raise HTTPException(status_code=400, detail=str(error))
 
 
+@router.get("/songs/rewind/{seconds}", dependencies=[Depends(verify_token)])
+async def rewind_song(seconds: int):
+    try:
+        if seconds is None or seconds < 0:
+            raise HTTPException(status_code=400, detail="Invalid rewind time")
+        
+        response = await service.rewind(seconds)
+        return success_response(response, "Rewind Song")
+    
+    except Exception as error:
+        logger.error(f"Error in Rewind Song API: {error}")
+        raise HTTPException(status_code=400, detail=str(error))
+
+
 @router.post("/songs/add/top", dependencies=[Depends(verify_token)])
 async def add_song_to_top(request: AddSongRequest):
     try:
@@ -232,13 +268,13 @@ async def add_playlist_to_queue(request: AddPlaylistRequest):
         if not request.playlistId:
             raise HTTPException(status_code=400, detail="Invalid playlist Id")
         
-        response = await service.add_playlist_to_queue(
+        response = await service.start_playlist_import(
             request.playlistId,
             request.source,
             request.requestedBy
         )
         
-        return success_response(response, f"Successfully Added {response['total']} songs to the queue")
+        return success_response(response, "Playlist import started")
     
     except Exception as error:
         logger.error(f"Error in Adding Playlist to Queue API: {error}")
@@ -264,18 +300,30 @@ async def add_playlist_to_top(request: AddPlaylistRequest):
         raise HTTPException(status_code=400, detail=str(error))
 
 
+@router.get("/playlist/import/{job_id}", dependencies=[Depends(verify_token)])
+async def get_playlist_import(job_id: str):
+    try:
+        response = await service.get_playlist_import(job_id)
+        return success_response(response, "Successfully Fetched playlist import")
+    
+    except Exception as error:
+        logger.error(f"Error in Get Playlist Import API: {error}")
+        raise HTTPException(status_code=404, detail=str(error))
+
+
 @router.post("/playlist/default", dependencies=[Depends(verify_token)])
 async def add_default_playlists(request: DefaultPlaylistRequest):
     try:
-        response = await service.add_default_playlist({
+        response = await service.start_default_playlist_import({
             "playlistId": request.playlistId,
             "title": request.title,
             "source": request.source,
             "isActive": request.isActive,
-            "genre": request.genre
+            "genre": request.genre,
+            "weight": request.weight
         })
         
-        return success_response(response, "Successfully Added default playlist")
+        return success_response(response, "Default playlist import started")
     
     except Exception as error:
         logger.error(f"Error in Adding Default Playlist API: {error}")
@@ -6,6 +6,22 @@ load_dotenv()
 class Config:
     NODE_ENV = os.getenv("NODE_ENV", "development")
     FFMPEG_ENV = os.getenv("FFMPEG_ENV", "development")
+    DOWNLOAD_AUDIO_FORMAT = os.getenv("DOWNLOAD_AUDIO_FORMAT", "original")
+    PLAYBACK_PROGRESS_INTERVAL = float(os.getenv("PLAYBACK_PROGRESS_INTERVAL", "5"))
+    PLAYBACK_UPCOMING_LEAD = float(os.getenv("PLAYBACK_UPCOMING_LEAD", "15"))
+    CROSSFADE_DURATION = float(os.getenv("CROSSFADE_DURATION", "0"))
+    STREAM_BITRATE = int(os.getenv("STREAM_BITRATE", "128"))
+    STREAM_BITRATE_LADDER = [int(bitrate) for bitrate in os.getenv("STREAM_BITRATE_LADDER", "").split(",") if bitrate.strip()]
+    HLS_ENABLED = os.getenv("HLS_ENABLED", "false").lower() == "true"
+    MAX_LISTENERS = int(os.getenv("MAX_LISTENERS", "1000"))
+    MAX_LISTENERS_PER_IP = int(os.getenv("MAX_LISTENERS_PER_IP", "0"))
+    TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "false").lower() == "true"
+    LISTENER_MAX_LAG_BYTES = int(os.getenv("LISTENER_MAX_LAG_BYTES", str(512 * 1024)))
+    LISTENER_LAG_POLICY = os.getenv("LISTENER_LAG_POLICY", "fastforward")
+    STREAM_WORKERS = int(os.getenv("STREAM_WORKERS", "0"))
+    STREAM_WORKER_PORT = int(os.getenv("STREAM_WORKER_PORT", "5001"))
+    STREAM_RING_PATH = os.getenv("STREAM_RING_PATH", "/dev/shm/mradio_stream.ring")
+    STATIONS = [station.strip() for station in os.getenv("STATIONS", "").split(",") if station.strip()]
     
     SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIEND_ID")
     SPOTIFY_CLIENT_SECRET = os.getenv("SPOTIFY_CLIEND_SECRET_ID")
@@ -26,5 +42,6 @@ class Config:
     ICECAST_DESCRIPTION = os.getenv("ICECAST_DESCRIPTION", "MRadio - Multi-platform Music Streaming")
     ICECAST_GENRE = os.getenv("ICECAST_GENRE", "Various")
     ICECAST_BITRATE = os.getenv("ICECAST_BITRATE", "128")
+    ICECAST_OUTPUTS = os.getenv("ICECAST_OUTPUTS")
 
 config = Config()
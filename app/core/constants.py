@@ -8,6 +8,9 @@ DEFAULT_CACHE_LOCATION = "cache"
 DEFAULT_TRACKS_LOCATION = "media/tracks"
 DEFAULT_FALLBACK_LOCATION = "media/fallback"
 
+DEFAULT_STATION_ID = "default"
+STATIONS_DIRECTORY = "stations"
+
 SONG_QUEUE_LOCATION = "data/queue.json"
 BLOCK_LIST_LOCATION = "data/blockList.json"
 DEFAULT_PLAYLIST_LOCATION = "data/defaultSongPlaylist.json"
@@ -15,8 +18,30 @@ DEFAULT_PLAYLIST_METADATA_LOCATION = "data/defaultPlaylistMetadata.json"
 COMMON_CONFIG_LOCATION = "data/commonConfig.json"
 
 DEFAULT_QUEUE_SIZE = 2
+TRACK_HISTORY_SIZE = 10
+PLAYLIST_IMPORT_CONCURRENCY = 2
 SONG_METADATA_UPDATE_TIME = 2 * 24 * 60 * 60 * 1000
+METADATA_REFRESH_INTERVAL = 15 * 60
+METADATA_REFRESH_JITTER = 60
+METADATA_REFRESH_CONCURRENCY = 2
+METADATA_REFRESH_RETRY_INTERVAL = 6 * 60 * 60
+ROTATION_NO_REPEAT_WINDOW = 20
+ROTATION_LOOKAHEAD = 3
+ROTATION_PREFETCH_COUNT = 1
 CACHE_SIZE = 1024 * 1024 * 1024
+AUDIO_FILE_EXTENSIONS = ['.mp3', '.m4a', '.mp4', '.webm', '.opus', '.ogg']
+STREAM_CHUNK_DURATION = 0.2
+STREAM_READ_AHEAD = 0.5
+SEEK_FADE_DURATION = 0.3
+STREAM_BURST_DURATION = 3
+ICY_METAINT = 16000
+LISTENER_RETRY_AFTER = 30
+STREAM_RING_SIZE = 8 * 1024 * 1024
+HTTP_POOL_SIZE = 50
+ICECAST_RECONNECT_BACKLOG = 2
+ICECAST_RECONNECT_COOLDOWN = 60
+HLS_SEGMENT_DURATION = 6
+HLS_WINDOW_SIZE = 6
 
 COMMON_CONFIG_KEYS = {
     "defaultPlaylistGenre": "defaultPlaylistGenre"
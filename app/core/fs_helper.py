@@ -20,8 +20,12 @@ class FSHelper:
         if directory_path and not self.exists(directory_path):
             self.create_directory(directory_path)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
         return True
     
     def exists(self, file_path: str) -> bool:
@@ -0,0 +1,21 @@
+import aiohttp
+from app.core.constants import HTTP_POOL_SIZE
+
+class HttpClient:
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE):
+        self.pool_size = pool_size
+        self.session = None
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300)
+            )
+        return self.session
+    
+    async def close(self):
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+http_client = HttpClient()
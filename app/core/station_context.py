@@ -0,0 +1,29 @@
+import os
+from contextvars import ContextVar
+from app.core.constants import DEFAULT_STATION_ID, STATIONS_DIRECTORY
+
+current_station: ContextVar[str] = ContextVar('current_station', default=DEFAULT_STATION_ID)
+
+def get_station_id() -> str:
+    return current_station.get()
+
+def station_path(location: str) -> str:
+    station_id = current_station.get()
+    if station_id == DEFAULT_STATION_ID:
+        return location
+    directory, name = os.path.split(location)
+    return os.path.join(directory, STATIONS_DIRECTORY, station_id, name)
+
+class StationLocal:
+    def __init__(self, factory):
+        self._factory = factory
+        self._instances = {}
+    
+    def get(self):
+        station_id = current_station.get()
+        if station_id not in self._instances:
+            self._instances[station_id] = self._factory()
+        return self._instances[station_id]
+    
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
@@ -10,6 +10,7 @@ from app.core.constants import (
     COMMON_CONFIG_LOCATION, SPOTIFY_TOKEN_LOCATION
 )
 from app.core import logger
+from app.core.station_context import station_path
 
 def get_ffmpeg_path() -> str:
     from app.core.config import config
@@ -24,6 +25,25 @@ def get_ffmpeg_path() -> str:
     else:
         raise ValueError("Unknown environment")
 
+def get_client_ip(request):
+    from app.core.config import config
+    if config.TRUST_PROXY_HEADERS:
+        forwarded_for = request.headers.get('x-forwarded-for')
+        if forwarded_for and forwarded_for.split(',')[0].strip():
+            return forwarded_for.split(',')[0].strip()
+        
+        forwarded = request.headers.get('forwarded')
+        if forwarded:
+            for directive in forwarded.split(',')[0].split(';'):
+                key, _, value = directive.strip().partition('=')
+                if key.lower() == 'for' and value:
+                    value = value.strip('"')
+                    if value.startswith('['):
+                        return value[1:value.find(']')]
+                    return value.split(':')[0]
+    
+    return request.client.host if request.client else None
+
 def get_cookies_path() -> str:
     logger.info("Fetching the cookies")
     cookies_path = os.path.join('config', 'cookies.txt')
@@ -40,10 +60,10 @@ def get_cookies_path() -> str:
     return cookies_path
 
 def get_queue_list_json():
-    return fs_helper.read_from_json(SONG_QUEUE_LOCATION, [])
+    return fs_helper.read_from_json(station_path(SONG_QUEUE_LOCATION), [])
 
 def save_queue_list_json(data):
-    return fs_helper.write_to_json(SONG_QUEUE_LOCATION, data)
+    return fs_helper.write_to_json(station_path(SONG_QUEUE_LOCATION), data)
 
 def get_token_list_json():
     return fs_helper.read_from_json(AUTH_TOKEN_LOCATION, [])
@@ -52,25 +72,25 @@ def save_token_list_json(data):
     return fs_helper.write_to_json(AUTH_TOKEN_LOCATION, data)
 
 def get_block_list_json():
-    return fs_helper.read_from_json(BLOCK_LIST_LOCATION, [])
+    return fs_helper.read_from_json(station_path(BLOCK_LIST_LOCATION), [])
 
 def save_block_list_json(data):
-    return fs_helper.write_to_json(BLOCK_LIST_LOCATION, data)
+    return fs_helper.write_to_json(station_path(BLOCK_LIST_LOCATION), data)
 
 def get_spotify_config_json():
     return fs_helper.read_from_json(SPOTIFY_TOKEN_LOCATION, {})
 
 def get_default_playlist_json():
-    return fs_helper.read_from_json(DEFAULT_PLAYLIST_LOCATION, [])
+    return fs_helper.read_from_json(station_path(DEFAULT_PLAYLIST_LOCATION), [])
 
 def save_default_playlist_json(data):
-    return fs_helper.write_to_json(DEFAULT_PLAYLIST_LOCATION, data)
+    return fs_helper.write_to_json(station_path(DEFAULT_PLAYLIST_LOCATION), data)
 
 def get_default_playlist_metadata_json():
-    return fs_helper.read_from_json(DEFAULT_PLAYLIST_METADATA_LOCATION, [])
+    return fs_helper.read_from_json(station_path(DEFAULT_PLAYLIST_METADATA_LOCATION), [])
 
 def save_default_playlist_metadata_json(data):
-    return fs_helper.write_to_json(DEFAULT_PLAYLIST_METADATA_LOCATION, data)
+    return fs_helper.write_to_json(station_path(DEFAULT_PLAYLIST_METADATA_LOCATION), data)
 
 def get_random_number(min_val: int, max_val: int) -> int:
     return random.randint(min_val, max_val)
@@ -90,6 +110,17 @@ def duration_formatter(duration) -> str:
     formatted = f"{minutes:02d}:{seconds:02d}"
     return formatted
 
+def duration_to_seconds(duration) -> int:
+    try:
+        if isinstance(duration, str) and ":" in duration:
+            seconds = 0
+            for part in duration.split(":"):
+                seconds = seconds * 60 + int(part)
+            return seconds
+        return int(float(duration))
+    except (ValueError, TypeError):
+        return 0
+
 def check_similarity(original: str, found: str) -> float:
     similarity = fuzz.token_set_ratio(original, found)
     return similarity
@@ -101,11 +132,20 @@ def extract_youtube_playlist_id(url: str) -> str:
     playlist_id = query_params.get('list', [None])[0]
     return playlist_id
 
+def extract_youtube_video_id(url: str) -> str:
+    from urllib.parse import urlparse, parse_qs
+    parsed_url = urlparse(url)
+    if parsed_url.hostname == 'youtu.be':
+        return parsed_url.path.lstrip('/') or None
+    query_params = parse_qs(parsed_url.query)
+    video_id = query_params.get('v', [None])[0]
+    return video_id
+
 def add_youtube_video_id(video_id: str) -> str:
     return f"https://www.youtube.com/watch?v={video_id}"
 
 def get_common_config_json():
-    return fs_helper.read_from_json(COMMON_CONFIG_LOCATION, {})
+    return fs_helper.read_from_json(station_path(COMMON_CONFIG_LOCATION), {})
 
 def save_common_config_json(data):
-    return fs_helper.write_to_json(COMMON_CONFIG_LOCATION, data)
+    return fs_helper.write_to_json(station_path(COMMON_CONFIG_LOCATION), data)
@@ -1,9 +1,9 @@
-import aiohttp
 import base64
 import json
 import time
 from pathlib import Path
 from app.core import logger
+from app.core.http_client import http_client
 from app.core.config import config
 from app.core.utils import check_similarity
 
@@ -30,11 +30,11 @@ class SpotifyAPI:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.token_url, data=data, headers=headers) as response:
-                    response_data = await response.json()
-                    access_token = response_data.get('access_token')
-                    return access_token
+            session = http_client.get_session()
+            async with session.post(self.token_url, data=data, headers=headers) as response:
+                response_data = await response.json()
+                access_token = response_data.get('access_token')
+                return access_token
         except Exception as error:
             logger.error(f'Error fetching access token: {str(error)}')
             raise error
@@ -79,17 +79,17 @@ class SpotifyAPI:
                 'Authorization': f'Bearer {access_token}',
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    data = await response.json()
-                    
-                    tracks = data.get('tracks', {}).get('items', [])
-                    
-                    for track in tracks:
-                        if check_similarity(query, track.get('name', '')) > 60:
-                            return track
-                    
-                    return None
+            session = http_client.get_session()
+            async with session.get(url, headers=headers) as response:
+                data = await response.json()
+                
+                tracks = data.get('tracks', {}).get('items', [])
+                
+                for track in tracks:
+                    if check_similarity(query, track.get('name', '')) > 60:
+                        return track
+                
+                return None
         except Exception as error:
             logger.error(f'Error searching for track: {str(error)}')
             raise error
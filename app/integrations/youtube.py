@@ -1,9 +1,14 @@
 import yt_dlp as ytdl
 import aiohttp
+from collections import OrderedDict
 from app.core import logger
-from app.core.utils import check_similarity, get_cookies_path
+from app.core.utils import check_similarity, add_youtube_video_id, extract_youtube_video_id
+from app.services.cookie_service import cookie_service
 
 class YouTube:
+    video_info_cache: OrderedDict = OrderedDict()
+    max_video_info_cache_size = 256
+    
     async def get_video_detail(self, name: str, artist_name: str = ""):
         try:
             search_query = f"{name} - {artist_name} official audio song music" if artist_name else f"{name} official audio song music"
@@ -43,121 +48,102 @@ class YouTube:
     
     async def get_video_detail_by_url(self, video_id: str):
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-            }
+            info = await self.extract_video_info(add_youtube_video_id(video_id))
             
-            with ytdl.YoutubeDL(ydl_opts) as ydl:
-                result = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
-                
-                if not result:
-                    return None
-                
-                return {
-                    'title': result.get('title'),
-                    'url': result.get('webpage_url'),
-                    'duration': {'timestamp': result.get('duration', 0)}
-                }
+            if not info:
+                return None
+            
+            return {
+                'title': info.get('title'),
+                'url': info.get('webpage_url'),
+                'duration': {'timestamp': info.get('duration', 0)}
+            }
         except Exception as error:
             logger.error(f"Error getting details: {str(error)}")
             raise error
     
-    async def validate_video(self, url: str):
-        try:
-            import os
-            cookies_path = get_cookies_path()
-            
-            has_cookies = os.path.exists(cookies_path)
-            valid_cookie_lines = 0
-            
-            if has_cookies:
-                with open(cookies_path, 'r') as f:
-                    cookies_content = f.read()
-                    cookie_lines = [
-                        line for line in cookies_content.split('\n')
-                        if line.strip() and not line.startswith('#') and '.youtube.com' in line
-                    ]
-                    valid_cookie_lines = len(cookie_lines)
-            
-            extraction_methods = [
+    async def extract_video_info(self, url: str):
+        video_id = extract_youtube_video_id(url)
+        if video_id and video_id in YouTube.video_info_cache:
+            YouTube.video_info_cache.move_to_end(video_id)
+            return YouTube.video_info_cache[video_id]
+        
+        cookies_path = cookie_service.get_path()
+        
+        extraction_methods = [
+            {
+                'name': 'without cookies',
+                'options': {
+                    'quiet': True,
+                    'no_warnings': True,
+                    'no_check_certificate': True,
+                    'ignoreerrors': True,
+                }
+            }
+        ]
+        
+        if cookie_service.has_youtube_cookies():
+            extraction_methods.extend([
                 {
-                    'name': 'without cookies',
+                    'name': 'with cookies',
                     'options': {
                         'quiet': True,
                         'no_warnings': True,
                         'no_check_certificate': True,
+                        'cookiefile': cookies_path,
                         'ignoreerrors': True,
                     }
-                }
-            ]
-            
-            if has_cookies and valid_cookie_lines > 0:
-                extraction_methods.extend([
-                    {
-                        'name': 'with cookies',
-                        'options': {
-                            'quiet': True,
-                            'no_warnings': True,
-                            'no_check_certificate': True,
-                            'cookiefile': cookies_path,
-                            'ignoreerrors': True,
-                        }
-                    },
-                    {
-                        'name': 'with cookies and audio format',
-                        'options': {
-                            'quiet': True,
-                            'no_warnings': True,
-                            'no_check_certificate': True,
-                            'cookiefile': cookies_path,
-                            'format': 'bestaudio[ext=m4a]/bestaudio/worst',
-                            'ignoreerrors': True,
-                        }
+                },
+                {
+                    'name': 'with cookies and audio format',
+                    'options': {
+                        'quiet': True,
+                        'no_warnings': True,
+                        'no_check_certificate': True,
+                        'cookiefile': cookies_path,
+                        'format': 'bestaudio[ext=m4a]/bestaudio/worst',
+                        'ignoreerrors': True,
                     }
-                ])
-            
-            info = None
-            used_method = None
-            
-            for method in extraction_methods:
-                try:
-                    logger.info(f"Trying video extraction {method['name']} for {url}")
-                    with ytdl.YoutubeDL(method['options']) as ydl:
-                        info = ydl.extract_info(url, download=False)
-                    used_method = method['name']
-                    logger.info(f"Successfully extracted video info using {method['name']}")
-                    break
-                except Exception as error:
-                    logger.warn(f"Video extraction failed using {method['name']}: {str(error)}")
-                    continue
-            
-            if not info or not info.get('duration'):
-                return {
-                    'status': False,
-                    'message': 'Unable to extract video information. The video might be private, unavailable, or region-locked.'
                 }
+            ])
+        
+        for method in cookie_service.order_methods(url, extraction_methods):
+            try:
+                logger.info(f"Trying video extraction {method['name']} for {url}")
+                with ytdl.YoutubeDL(method['options']) as ydl:
+                    result = ydl.extract_info(url, download=False)
+                if not result:
+                    logger.warn(f"Video extraction returned no data using {method['name']}")
+                    continue
+                cookie_service.record_success(url, method['name'])
+                logger.info(f"Successfully extracted video info using {method['name']}")
+            except Exception as error:
+                logger.warn(f"Video extraction failed using {method['name']}: {str(error)}")
+                continue
+            
+            info = {
+                'id': result.get('id') or video_id,
+                'title': result.get('title'),
+                'webpage_url': result.get('webpage_url') or url,
+                'duration': result.get('duration'),
+                'categories': result.get('categories') or [],
+                'tags': result.get('tags') or [],
+                'extractionMethod': method['name']
+            }
             
-            duration = int(info.get('duration', 0))
-            
-            if duration > 600:
-                return {'status': False, 'message': 'Video duration exceeds 10 minutes'}
-            
-            categories = info.get('categories', [])
-            tags = info.get('tags', [])
-            is_music_category = (
-                any('music' in str(cat).lower() for cat in categories) or
-                any('music' in str(tag).lower() for tag in tags)
-            )
-            
-            if not is_music_category:
-                return {'status': False, 'message': 'Video is not in the Music category'}
+            if info['id']:
+                YouTube.video_info_cache[info['id']] = info
+                while len(YouTube.video_info_cache) > YouTube.max_video_info_cache_size:
+                    YouTube.video_info_cache.popitem(last=False)
             
-            return {
-                'status': True,
-                'message': f"Successful (using {used_method})",
-                'extractionMethod': used_method
-            }
+            return info
+        
+        return None
+    
+    async def validate_video(self, url: str):
+        try:
+            info = await self.extract_video_info(url)
+            return self.validate_video_info(info)
         except Exception as error:
             logger.error(f'Video validation error: {str(error)}')
             return {
@@ -165,6 +151,35 @@ class YouTube:
                 'message': f"Video validation error: {str(error)}"
             }
     
+    def validate_video_info(self, info):
+        if not info or not info.get('duration'):
+            return {
+                'status': False,
+                'message': 'Unable to extract video information. The video might be private, unavailable, or region-locked.'
+            }
+        
+        duration = int(info.get('duration', 0))
+        
+        if duration > 600:
+            return {'status': False, 'message': 'Video duration exceeds 10 minutes'}
+        
+        categories = info.get('categories', [])
+        tags = info.get('tags', [])
+        is_music_category = (
+            any('music' in str(cat).lower() for cat in categories) or
+            any('music' in str(tag).lower() for tag in tags)
+        )
+        
+        if not is_music_category:
+            return {'status': False, 'message': 'Video is not in the Music category'}
+        
+        used_method = info.get('extractionMethod')
+        return {
+            'status': True,
+            'message': f"Successful (using {used_method})",
+            'extractionMethod': used_method
+        }
+    
     async def get_playlist_detail(self, list_id: str):
         try:
             ydl_opts = {
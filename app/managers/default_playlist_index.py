@@ -0,0 +1,104 @@
+import random
+from app.core.station_context import StationLocal
+
+class DefaultPlaylistIndex:
+    def __init__(self):
+        self.loaded = False
+        self.playlists = {}
+        self.entries_by_playlist = {}
+        self.candidates = {}
+    
+    def ensure_loaded(self):
+        if self.loaded:
+            return
+        
+        from app.managers.default_playlist_manager import DefaultPlaylistManager
+        from app.managers.default_playlist_metadata_manager import DefaultPlaylistMetadataManager
+        
+        self.playlists = self.group_playlists(DefaultPlaylistManager().get_all())
+        self.entries_by_playlist = self.group_entries(DefaultPlaylistMetadataManager().items)
+        self.candidates = {}
+        self.loaded = True
+    
+    def group_playlists(self, playlists):
+        return {
+            playlist.get('playlistId'): (playlist.get('genre'), bool(playlist.get('isActive')), self.parse_weight(playlist.get('weight')))
+            for playlist in playlists
+        }
+    
+    def parse_weight(self, weight):
+        try:
+            return max(1, int(weight))
+        except (TypeError, ValueError):
+            return 1
+    
+    def group_entries(self, entries):
+        grouped = {}
+        for entry in entries:
+            grouped.setdefault(entry.get('playlistId'), []).append(entry)
+        return grouped
+    
+    def get_keys(self, playlist_id):
+        if playlist_id not in self.playlists:
+            return []
+        genre, is_active, _ = self.playlists[playlist_id]
+        return [(genre, is_active), ('all', is_active)]
+    
+    def invalidate(self, playlist_ids):
+        for playlist_id in playlist_ids:
+            for key in self.get_keys(playlist_id):
+                self.candidates.pop(key, None)
+    
+    def set_playlists(self, playlists):
+        if not self.loaded:
+            return
+        
+        updated = self.group_playlists(playlists)
+        changed = [
+            playlist_id
+            for playlist_id in set(self.playlists) | set(updated)
+            if self.playlists.get(playlist_id) != updated.get(playlist_id)
+        ]
+        
+        self.invalidate(changed)
+        self.playlists = updated
+        self.invalidate(changed)
+    
+    def set_metadata(self, entries):
+        if not self.loaded:
+            return
+        
+        updated = self.group_entries(entries)
+        changed = [
+            playlist_id
+            for playlist_id in set(self.entries_by_playlist) | set(updated)
+            if self.entries_by_playlist.get(playlist_id) != updated.get(playlist_id)
+        ]
+        
+        self.entries_by_playlist = updated
+        self.invalidate(changed)
+    
+    def get_candidates(self, genre=None, is_active=True):
+        self.ensure_loaded()
+        
+        key = ('all' if genre in (None, 'all') else genre, is_active)
+        if key not in self.candidates:
+            self.candidates[key] = [
+                entry
+                for playlist_id, (playlist_genre, playlist_active, _) in self.playlists.items()
+                if playlist_active == is_active and (key[0] == 'all' or playlist_genre == key[0])
+                for entry in self.entries_by_playlist.get(playlist_id, [])
+            ]
+        return self.candidates[key]
+    
+    def get_weight(self, entry):
+        playlist = self.playlists.get(entry.get('playlistId'))
+        return playlist[2] if playlist else 1
+    
+    def get_random(self, genre=None):
+        candidates = self.get_candidates(genre)
+        if not candidates:
+            return None
+        return random.choice(candidates)
+
+default_playlist_index = StationLocal(DefaultPlaylistIndex)
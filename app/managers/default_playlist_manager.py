@@ -1,6 +1,7 @@
 from datetime import datetime
 from app.managers.base_queue_manager import BaseQueueManager
 from app.core.utils import get_default_playlist_json, save_default_playlist_json
+from app.managers.default_playlist_index import default_playlist_index
 
 class DefaultPlaylistManager(BaseQueueManager):
     def __init__(self):
@@ -8,7 +9,9 @@ class DefaultPlaylistManager(BaseQueueManager):
             return get_default_playlist_json()
         
         def save_function(items):
-            return save_default_playlist_json(items)
+            saved = save_default_playlist_json(items)
+            default_playlist_index.set_playlists(items)
+            return saved
         
         def validate_function(item):
             return isinstance(item, dict) and item.get('title') and item.get('playlistId') and item.get('source')
@@ -29,3 +32,14 @@ class DefaultPlaylistManager(BaseQueueManager):
     
     def add_to_queue(self, item):
         return self.add(item)
+    
+    def update_metadata_timestamp(self, playlist_id, key='metadataUpdatedAt'):
+        for item in self.items:
+            if item.get('playlistId') == playlist_id:
+                item[key] = datetime.now().isoformat()
+                self.save_items()
+                return item
+        return None
+    
+    def update_refresh_attempt(self, playlist_id):
+        return self.update_metadata_timestamp(playlist_id, 'metadataRefreshAttemptedAt')
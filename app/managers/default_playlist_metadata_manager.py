@@ -3,6 +3,7 @@ from app.core.utils import (
     duration_formatter, get_default_playlist_metadata_json,
     save_default_playlist_metadata_json, get_default_playlist_json
 )
+from app.managers.default_playlist_index import default_playlist_index
 
 class DefaultPlaylistMetadataManager(BaseQueueManager):
     def __init__(self):
@@ -17,7 +18,9 @@ class DefaultPlaylistMetadataManager(BaseQueueManager):
             ]
         
         def save_function(items):
-            return save_default_playlist_metadata_json(items)
+            saved = save_default_playlist_metadata_json(items)
+            default_playlist_index.set_metadata(items)
+            return saved
         
         def validate_function(item):
             return isinstance(item, dict) and item.get('title') and item.get('url')
@@ -53,6 +56,10 @@ class DefaultPlaylistMetadataManager(BaseQueueManager):
         if not filters:
             return all_data
         
+        playlists = None
+        if 'isActive' in filters or 'genre' in filters:
+            playlists = {p.get('playlistId'): p for p in get_default_playlist_json()}
+        
         filtered = []
         for item in all_data:
             matches = True
@@ -63,7 +70,7 @@ class DefaultPlaylistMetadataManager(BaseQueueManager):
                 matches = False
             
             if 'isActive' in filters or 'genre' in filters:
-                playlist = self.get_playlist_metadata(item.get('playlistId'))
+                playlist = playlists.get(item.get('playlistId'))
                 
                 if playlist:
                     if 'isActive' in filters and playlist.get('isActive') != filters['isActive']:
@@ -96,3 +103,27 @@ class DefaultPlaylistMetadataManager(BaseQueueManager):
     
     def add_many_to_top(self, items):
         return self.add_many(items, True)
+    
+    def replace_playlist(self, playlist_id, items):
+        retained = [item for item in self.items if item.get('playlistId') != playlist_id]
+        seen_urls = set(item.get('url') for item in retained)
+        
+        replacement = []
+        for item in items:
+            if self.validate_item(item) and item.get('url') not in seen_urls:
+                seen_urls.add(item.get('url'))
+                replacement.append(self.format_item({**item, 'playlistId': playlist_id}))
+        
+        self.items = retained + replacement
+        self.save_items()
+        return len(replacement)
+    
+    def remove_playlist(self, playlist_id):
+        retained = [item for item in self.items if item.get('playlistId') != playlist_id]
+        removed_count = len(self.items) - len(retained)
+        
+        if removed_count > 0:
+            self.items = retained
+            self.save_items()
+        
+        return removed_count
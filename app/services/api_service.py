@@ -1,6 +1,6 @@
 from app.core.logger import logger
 from app.core.crypto import generate_256bit_token
-from app.core.utils import duration_formatter
+from app.core.utils import duration_formatter, add_youtube_video_id
 from app.core.constants import DEFAULT_QUEUE_SIZE
 from app.managers.song_queue_manager import SongQueueManager
 from app.managers.token_manager import TokenManager
@@ -9,6 +9,7 @@ from app.managers.default_playlist_manager import DefaultPlaylistManager
 from app.managers.default_playlist_metadata_manager import DefaultPlaylistMetadataManager
 from app.services.metadata_fetcher import generate_song_metadata, generate_playlist_metadata
 from app.services.common_config_service import common_config_service
+from app.services.playlist_import_service import playlist_import_service
 from app.integrations.youtube import YouTube
 from datetime import datetime
 
@@ -21,14 +22,14 @@ class Service:
         self.queue_instance = queue
     
     async def get_current_song(self) -> dict:
-        if not self.queue_instance or not self.queue_instance.tracks:
+        if not self.queue_instance or not self.queue_instance.current_track:
             raise Exception("No tracks available")
         
-        track = self.queue_instance.tracks[self.queue_instance.index]
+        track = self.queue_instance.current_track
         return {
-            "title": track["title"],
-            "duration": duration_formatter(track.get("duration", 0)),
-            "requestedBy": track.get("requestedBy", "anonymous")
+            "title": track.title,
+            "duration": duration_formatter(track.duration or 0),
+            "requestedBy": track.requested_by or "anonymous"
         }
     
     async def seek_song(self, seconds: int) -> bool:
@@ -38,7 +39,7 @@ class Service:
     
     async def get_queue_list(self) -> list:
         song_queue = SongQueueManager()
-        track_list = self.queue_instance.tracks if self.queue_instance else []
+        track_list = [track.to_dict() for track in self.queue_instance.track_list.get_all()] if self.queue_instance else []
         queue_song_list = song_queue.print_queue()
         
         response = []
@@ -53,19 +54,17 @@ class Service:
         return response
     
     async def get_upcoming_song(self) -> dict:
-        if not self.queue_instance or not self.queue_instance.tracks:
+        track = self.queue_instance.track_list.get_upcoming() if self.queue_instance else None
+        if not track:
             raise Exception("No tracks available")
         
-        next_index = (self.queue_instance.index + 1) % len(self.queue_instance.tracks)
-        track = self.queue_instance.tracks[next_index]
-        
-        formatted_duration = duration_formatter(track.get("duration", 0))
-        logger.info(f"Upcoming song duration: {track.get('title')} - {formatted_duration}")
+        formatted_duration = duration_formatter(track.duration or 0)
+        logger.info(f"Upcoming song duration: {track.title} - {formatted_duration}")
         
         return {
-            "title": track["title"],
+            "title": track.title,
             "duration": formatted_duration,
-            "requestedBy": track.get("requestedBy", "anonymous")
+            "requestedBy": track.requested_by or "anonymous"
         }
     
     async def skip(self) -> bool:
@@ -73,9 +72,14 @@ class Service:
             await self.queue_instance.skip()
         return True
     
-    async def previous(self) -> bool:
+    async def previous(self, steps: int = 1) -> bool:
+        if self.queue_instance:
+            await self.queue_instance.previous(steps)
+        return True
+    
+    async def rewind(self, seconds: int) -> bool:
         if self.queue_instance:
-            await self.queue_instance.previous()
+            await self.queue_instance.rewind(seconds)
         return True
     
     async def add_song_to_queue(self, song_name: str, requested_by: str = "anonymous", 
@@ -107,6 +111,20 @@ class Service:
         
         return {"added": True, "total": len(metadata)}
     
+    async def start_playlist_import(self, playlist_id: str, source: str = "youtube", 
+                                     requested_by: str = "anonymous") -> dict:
+        def persist(metadata):
+            song_queue = SongQueueManager()
+            return song_queue.add_many_to_queue(metadata)
+        
+        return playlist_import_service.start("queue", playlist_id, source, requested_by, persist)
+    
+    async def get_playlist_import(self, job_id: str) -> dict:
+        job = playlist_import_service.get_job(job_id)
+        if not job:
+            raise Exception("Playlist import job not found")
+        return job
+    
     async def add_playlist_to_top(self, playlist_id: str, source: str = "youtube", 
                                    requested_by: str = "anonymous") -> dict:
         metadata = await generate_playlist_metadata(playlist_id, source, requested_by)
@@ -137,11 +155,12 @@ class Service:
     
     async def remove_from_queue(self, params: dict) -> dict:
         index = params.get("index", 0)
-        if index <= DEFAULT_QUEUE_SIZE:
-            raise Exception(f"Cannot remove songs from positions 1 to {DEFAULT_QUEUE_SIZE}")
+        player_track_count = len(self.queue_instance.track_list) if self.queue_instance else DEFAULT_QUEUE_SIZE
+        if index <= player_track_count:
+            raise Exception(f"Cannot remove songs from positions 1 to {player_track_count}")
         
         song_queue = SongQueueManager()
-        removed_item = song_queue.remove_at_index(index - DEFAULT_QUEUE_SIZE)
+        removed_item = song_queue.remove_at_index(index - player_track_count)
         
         if not removed_item:
             raise Exception("Invalid index or queue is empty.")
@@ -172,17 +191,17 @@ class Service:
                                              requested_by: str = "anonymous", 
                                              source: str = "youtube") -> dict:
         youtube = YouTube()
-        validation = await youtube.validate_video(url)
+        video_info = await youtube.extract_video_info(url or add_youtube_video_id(video_id))
+        validation = youtube.validate_video_info(video_info)
         
         if not validation["status"]:
             raise Exception(validation["message"])
         
-        song_detail = await youtube.get_video_detail_by_url(video_id)
         metadata = {
             "requestedBy": requested_by,
-            "title": song_detail.get("title"),
-            "duration": song_detail.get("duration", {}).get("timestamp", 0),
-            "url": song_detail.get("url"),
+            "title": video_info.get("title"),
+            "duration": video_info.get("duration", 0),
+            "url": video_info.get("webpage_url"),
             "urlType": "youtube"
         }
         
@@ -259,6 +278,7 @@ class Service:
             requested_by = data.get("requestedBy", "auto")
             is_active = data.get("isActive", True)
             genre = data.get("genre", "mix")
+            weight = data.get("weight", 1)
             
             metadata = await generate_playlist_metadata(playlist_id, source, requested_by)
             
@@ -266,22 +286,16 @@ class Service:
                 logger.warning(f"No songs found in the playlist {playlist_id} from {source}")
                 return {"added": False, "total": 0}
             
-            default_playlist_store = DefaultPlaylistManager()
-            default_playlist_store.add({
+            self.add_default_playlist_entry({
                 "playlistId": playlist_id,
                 "title": title,
                 "source": source,
-                "metadataUpdatedAt": datetime.now().isoformat(),
                 "isActive": is_active,
-                "genre": genre
+                "genre": genre,
+                "weight": weight
             })
             
-            metadata_store = DefaultPlaylistMetadataManager()
-            updated_metadata = [
-                {**item, "playlistId": playlist_id}
-                for item in metadata
-            ]
-            metadata_store.add_many(updated_metadata)
+            self.add_default_playlist_metadata(playlist_id, metadata)
             
             return {"added": True, "total": len(metadata)}
         except Exception as error:
@@ -289,6 +303,45 @@ class Service:
             logger.warning(f"Skipping playlist {playlist_id} due to errors")
             return {"added": False, "total": 0}
     
+    def add_default_playlist_entry(self, data: dict) -> bool:
+        default_playlist_store = DefaultPlaylistManager()
+        return default_playlist_store.add({
+            "playlistId": data.get("playlistId"),
+            "title": data.get("title"),
+            "source": data.get("source"),
+            "metadataUpdatedAt": datetime.now().isoformat(),
+            "isActive": data.get("isActive", True),
+            "genre": data.get("genre", "mix"),
+            "weight": data.get("weight", 1)
+        })
+    
+    def add_default_playlist_metadata(self, playlist_id: str, metadata: list) -> int:
+        metadata_store = DefaultPlaylistMetadataManager()
+        updated_metadata = [
+            {**item, "playlistId": playlist_id}
+            for item in metadata
+        ]
+        return metadata_store.add_many(updated_metadata)
+    
+    async def start_default_playlist_import(self, data: dict) -> dict:
+        playlist_id = data.get("playlistId")
+        
+        def register_playlist(metadata):
+            if not self.add_default_playlist_entry(data):
+                raise Exception(f"Default playlist {playlist_id} already exists or is invalid")
+        
+        def persist(metadata):
+            return self.add_default_playlist_metadata(playlist_id, metadata)
+        
+        return playlist_import_service.start(
+            "default",
+            playlist_id,
+            data.get("source"),
+            data.get("requestedBy", "auto"),
+            persist,
+            register_playlist
+        )
+    
     async def remove_default_playlist(self, index: int) -> dict:
         default_playlist_store = DefaultPlaylistManager()
         default_playlist_metadata_store = DefaultPlaylistMetadataManager()
@@ -301,18 +354,29 @@ class Service:
         if not removed_playlist:
             raise Exception("Failed to remove playlist")
         
-        all_metadata_entries = default_playlist_metadata_store.get_all()
+        default_playlist_metadata_store.remove_playlist(removed_playlist.get("playlistId"))
         
-        indexes_to_remove = sorted([
-            idx + 1
-            for idx, entry in enumerate(all_metadata_entries)
-            if entry.get("playlistId") == removed_playlist.get("playlistId")
-        ], reverse=True)
+        return removed_playlist
+    
+    async def refresh_default_playlist(self, playlist: dict) -> dict:
+        playlist_id = playlist.get("playlistId")
+        source = playlist.get("source")
         
-        for idx in indexes_to_remove:
-            default_playlist_metadata_store.remove_at_index(idx)
+        default_playlist_store = DefaultPlaylistManager()
+        default_playlist_store.update_refresh_attempt(playlist_id)
         
-        return removed_playlist
+        metadata = await generate_playlist_metadata(playlist_id, source, playlist.get("requestedBy", "auto"))
+        
+        if not metadata:
+            logger.warning(f"No songs found while refreshing playlist {playlist_id} from {source}, keeping existing metadata")
+            return {"refreshed": False, "total": 0}
+        
+        metadata_store = DefaultPlaylistMetadataManager()
+        total = metadata_store.replace_playlist(playlist_id, metadata)
+        
+        default_playlist_store.update_metadata_timestamp(playlist_id)
+        
+        return {"refreshed": True, "total": total}
     
     async def get_default_playlist(self) -> list:
         default_playlist_store = DefaultPlaylistManager()
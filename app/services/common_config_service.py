@@ -1,6 +1,7 @@
 from app.core.utils import get_common_config_json, save_common_config_json, get_default_playlist_json
 from app.core.constants import COMMON_CONFIG_KEYS
 from app.core import logger
+from app.core.station_context import StationLocal
 
 class CommonConfigService:
     def __init__(self):
@@ -98,4 +99,4 @@ class CommonConfigService:
             logger.error('Error deleting config', error=str(error))
             return False
 
-common_config_service = CommonConfigService()
+common_config_service = StationLocal(CommonConfigService)
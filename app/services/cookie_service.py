@@ -0,0 +1,65 @@
+import os
+from urllib.parse import urlparse
+from app.core import logger
+from app.core.utils import get_cookies_path
+
+class CookieService:
+    def __init__(self):
+        self.cookies_path = None
+        self.mtime = None
+        self.youtube_cookie_count = 0
+        self.preferred_methods = {}
+    
+    def get_path(self) -> str:
+        if not self.cookies_path or not os.path.exists(self.cookies_path):
+            self.cookies_path = get_cookies_path()
+        return self.cookies_path
+    
+    def refresh(self):
+        cookies_path = self.get_path()
+        
+        try:
+            mtime = os.path.getmtime(cookies_path)
+        except OSError:
+            self.mtime = None
+            self.youtube_cookie_count = 0
+            return
+        
+        if mtime == self.mtime:
+            return
+        
+        with open(cookies_path, 'r') as f:
+            cookie_lines = [
+                line for line in f.read().split('\n')
+                if line.strip() and not line.startswith('#') and '.youtube.com' in line
+            ]
+        
+        self.mtime = mtime
+        self.youtube_cookie_count = len(cookie_lines)
+        
+        if self.youtube_cookie_count > 0:
+            logger.info(f"Loaded {self.youtube_cookie_count} YouTube cookies from {cookies_path}")
+        else:
+            logger.warn('No valid YouTube cookies found in cookies.txt')
+    
+    def has_youtube_cookies(self) -> bool:
+        self.refresh()
+        return self.youtube_cookie_count > 0
+    
+    def get_host(self, url: str) -> str:
+        host = urlparse(url).hostname or ''
+        return host[4:] if host.startswith('www.') else host
+    
+    def order_methods(self, url: str, methods: list) -> list:
+        preferred = self.preferred_methods.get(self.get_host(url))
+        if not preferred:
+            return methods
+        return sorted(methods, key=lambda method: method['name'] != preferred)
+    
+    def record_success(self, url: str, method_name: str):
+        host = self.get_host(url)
+        if self.preferred_methods.get(host) != method_name:
+            logger.info(f"Preferring extraction {method_name} for {host}")
+            self.preferred_methods[host] = method_name
+
+cookie_service = CookieService()
@@ -0,0 +1,97 @@
+import asyncio
+import random
+from datetime import datetime
+from app.core import logger
+from app.core.constants import (
+    SONG_METADATA_UPDATE_TIME, METADATA_REFRESH_INTERVAL,
+    METADATA_REFRESH_JITTER, METADATA_REFRESH_CONCURRENCY, METADATA_REFRESH_RETRY_INTERVAL
+)
+from app.managers.default_playlist_manager import DefaultPlaylistManager
+from app.core.station_context import StationLocal
+
+class MetadataRefreshScheduler:
+    def __init__(self):
+        self.interval = METADATA_REFRESH_INTERVAL
+        self.jitter = METADATA_REFRESH_JITTER
+        self.concurrency = METADATA_REFRESH_CONCURRENCY
+        self.task = None
+        self.refreshing = set()
+    
+    def start(self):
+        if self.task and not self.task.done():
+            return
+        self.task = asyncio.create_task(self.run())
+        logger.info(f"Metadata refresh scheduler started (every {self.interval}s)")
+    
+    def stop(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+    
+    async def run(self):
+        while True:
+            try:
+                await self.refresh_stale_playlists()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.error(f"Error in metadata refresh scheduler: {error}")
+            
+            await asyncio.sleep(self.interval + random.uniform(0, self.jitter))
+    
+    def is_stale(self, playlist: dict) -> bool:
+        try:
+            attempt_date = datetime.fromisoformat(playlist["metadataRefreshAttemptedAt"])
+            if (datetime.now() - attempt_date).total_seconds() < METADATA_REFRESH_RETRY_INTERVAL:
+                return False
+        except (KeyError, TypeError, ValueError):
+            pass
+        
+        try:
+            metadata_date = datetime.fromisoformat(playlist["metadataUpdatedAt"])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return (datetime.now() - metadata_date).total_seconds() * 1000 > SONG_METADATA_UPDATE_TIME
+    
+    def get_stale_playlists(self) -> list:
+        default_playlist_store = DefaultPlaylistManager()
+        return [
+            playlist
+            for playlist in default_playlist_store.get_all()
+            if playlist.get("isActive")
+            and playlist.get("playlistId") not in self.refreshing
+            and self.is_stale(playlist)
+        ]
+    
+    async def refresh_stale_playlists(self):
+        stale_playlists = self.get_stale_playlists()
+        if not stale_playlists:
+            return
+        
+        logger.info(f"Refreshing metadata for {len(stale_playlists)} stale playlists")
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def refresh_with_limit(playlist):
+            await asyncio.sleep(random.uniform(0, self.jitter))
+            async with semaphore:
+                await self.refresh_playlist(playlist)
+        
+        await asyncio.gather(*(refresh_with_limit(playlist) for playlist in stale_playlists))
+    
+    async def refresh_playlist(self, playlist: dict):
+        from app.services.api_service import Service
+        
+        playlist_id = playlist["playlistId"]
+        self.refreshing.add(playlist_id)
+        
+        try:
+            logger.info(f"Updating the metadata for: {playlist['title']}")
+            api_service = Service()
+            result = await api_service.refresh_default_playlist(playlist)
+            logger.info(f"Refreshed {result['total']} songs for: {playlist['title']}")
+        except Exception as error:
+            logger.error(f"Failed to refresh metadata for {playlist.get('title')}: {error}")
+        finally:
+            self.refreshing.discard(playlist_id)
+
+metadata_refresh_scheduler = StationLocal(MetadataRefreshScheduler)
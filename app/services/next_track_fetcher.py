@@ -1,22 +1,21 @@
+import asyncio
 import os
 from pathlib import Path
 from app.core.logger import logger
-from app.core.constants import DEFAULT_FALLBACK_LOCATION, COMMON_CONFIG_KEYS
+from app.core.constants import DEFAULT_FALLBACK_LOCATION, COMMON_CONFIG_KEYS, AUDIO_FILE_EXTENSIONS, ROTATION_PREFETCH_COUNT
 from app.core.utils import get_random_number
 from app.managers.song_queue_manager import SongQueueManager
-from app.managers.default_playlist_manager import DefaultPlaylistManager
-from app.managers.default_playlist_metadata_manager import DefaultPlaylistMetadataManager
+from app.services.rotation_engine import rotation_engine
 from app.streaming.cache_manager import cache_manager
 from app.services.common_config_service import common_config_service
-from app.streaming.download import Downloader
-from datetime import datetime, timedelta
+from app.streaming.download import downloader
 
 async def get_fallback_track(directory: str = DEFAULT_FALLBACK_LOCATION) -> dict:
     try:
         if not os.path.exists(directory):
             raise FileNotFoundError(f"Fallback directory not found: {directory}")
         
-        files = [f for f in os.listdir(directory) if f.endswith('.mp3')]
+        files = [f for f in os.listdir(directory) if os.path.splitext(f)[1] in AUDIO_FILE_EXTENSIONS]
         
         if not files:
             raise FileNotFoundError(f"No fallback tracks available in directory: {directory}")
@@ -24,7 +23,7 @@ async def get_fallback_track(directory: str = DEFAULT_FALLBACK_LOCATION) -> dict
         random_track = files[get_random_number(0, len(files) - 1)]
         
         return {
-            "title": random_track.replace('.mp3', ''),
+            "title": os.path.splitext(random_track)[0],
             "url": os.path.join(directory, random_track),
             "urlType": "fallback",
             "duration": 0,
@@ -34,74 +33,50 @@ async def get_fallback_track(directory: str = DEFAULT_FALLBACK_LOCATION) -> dict
         logger.error(f"Fallback mechanism failed: {error}")
         raise
 
-async def check_and_refresh_metadata(playlist: dict):
-    from app.services.api_service import Service
-    
-    TWO_DAYS_MS = 2 * 24 * 60 * 60 * 1000
-    metadata_date = datetime.fromisoformat(playlist["metadataUpdatedAt"])
-    now = datetime.now()
-    
-    if (now - metadata_date).total_seconds() * 1000 > TWO_DAYS_MS:
-        logger.info(f"Updating the metadata for: {playlist['title']}")
-        api_service = Service()
-        await api_service.remove_default_playlist(playlist["index"])
-        await api_service.add_default_playlist({
-            "playlistId": playlist["playlistId"],
-            "title": playlist["title"],
-            "source": playlist["source"],
-            "isActive": playlist["isActive"],
-            "genre": playlist["genre"]
-        })
-
 async def empty_song_queue_handler() -> dict:
     try:
-        default_playlist_metadata = DefaultPlaylistMetadataManager()
-        default_playlist_store = DefaultPlaylistManager()
         genre = await common_config_service.get(COMMON_CONFIG_KEYS["defaultPlaylistGenre"])
         
-        filter_criteria = {
-            "isActive": True,
-            "genre": None if genre == "all" else genre
-        }
-        
-        active_playlists = [
-            {**playlist, "index": idx + 1}
-            for idx, playlist in enumerate(default_playlist_store.get_all())
-            if playlist.get("isActive") and (genre == "all" or playlist.get("genre") == genre)
-        ]
-        
-        for playlist in active_playlists:
-            await check_and_refresh_metadata(playlist)
-        
-        default_playlist_arr = default_playlist_metadata.get_all(filter_criteria)
-        if not default_playlist_arr:
+        track = rotation_engine.next(genre)
+        if not track:
             return await get_fallback_track()
         
-        return default_playlist_arr[get_random_number(0, len(default_playlist_arr) - 1)]
+        prefetch_upcoming_tracks(genre)
+        return track
     except Exception as error:
         logger.error(f"Error in empty_song_queue_handler: {error}")
         return await get_fallback_track()
 
+def prefetch_upcoming_tracks(genre: str = None):
+    for track in rotation_engine.peek(genre, ROTATION_PREFETCH_COUNT):
+        if not cache_manager.find_cached_path(track["title"]) and not cache_manager.find_original_path(track["title"]):
+            asyncio.create_task(prefetch_track(track))
+
+async def prefetch_track(track: dict):
+    try:
+        logger.info(f"Prefetching upcoming track: {track['title']}")
+        await fetch_by_url_type(track)
+    except Exception as error:
+        logger.warning(f"Failed to prefetch {track.get('title')}: {error}")
+
 def create_track_response(song: dict, cached_path: str = None) -> dict:
     return {
         "url": cached_path or song["url"],
         "title": song["title"],
         "duration": song["duration"],
-        "requestedBy": song["requestedBy"]
+        "requestedBy": song["requestedBy"],
+        "downloaded": song.get("downloaded", False)
     }
 
 async def download_from_youtube(song_data: dict) -> dict:
-    downloader = Downloader()
     result = await downloader.download_video(song_data["url"], song_data["title"])
     return {"url": result["url"], "title": song_data["title"]}
 
 async def download_from_jiosaavn(song_data: dict) -> dict:
-    downloader = Downloader()
     result = await downloader.download_jiosaavn(song_data["url"], song_data["title"])
     return {"url": result["url"], "title": song_data["title"]}
 
 async def download_from_soundcloud(song_data: dict) -> dict:
-    downloader = Downloader()
     result = await downloader.download_soundcloud(song_data["url"], song_data["title"])
     return {"url": result["url"], "title": song_data["title"]}
 
@@ -145,7 +120,8 @@ async def fetch_next_track() -> dict:
             return create_track_response({
                 **song_result,
                 "requestedBy": track_to_process["requestedBy"],
-                "duration": track_to_process["duration"]
+                "duration": track_to_process["duration"],
+                "downloaded": track_to_process.get("urlType") != "fallback"
             })
         
         except Exception as error:
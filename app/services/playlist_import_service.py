@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+from datetime import datetime
+from app.core import logger
+from app.core.constants import PLAYLIST_IMPORT_CONCURRENCY
+from app.core.station_context import StationLocal
+from app.services.metadata_fetcher import generate_playlist_metadata
+from app.streaming.socket_manager import socket_manager
+
+class PlaylistImportService:
+    def __init__(self):
+        self.jobs = {}
+        self.tasks = {}
+        self.max_finished_jobs = 50
+        self.semaphore = None
+    
+    def start(self, kind: str, playlist_id: str, source: str, requested_by: str, persist, on_metadata=None) -> dict:
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(PLAYLIST_IMPORT_CONCURRENCY)
+        
+        job = {
+            'id': str(uuid.uuid4()),
+            'kind': kind,
+            'playlistId': playlist_id,
+            'source': source,
+            'requestedBy': requested_by,
+            'status': 'queued',
+            'total': 0,
+            'processed': 0,
+            'added': 0,
+            'error': None,
+            'createdAt': datetime.now().isoformat(),
+            'finishedAt': None
+        }
+        self.jobs[job['id']] = job
+        self.prune_finished_jobs()
+        
+        task = asyncio.create_task(self.run(job, persist, on_metadata))
+        self.tasks[job['id']] = task
+        task.add_done_callback(lambda _: self.tasks.pop(job['id'], None))
+        
+        logger.info(f"Queued playlist import {job['id']} for {playlist_id} from {source}")
+        return dict(job)
+    
+    async def run(self, job: dict, persist, on_metadata=None):
+        async with self.semaphore:
+            try:
+                job['status'] = 'running'
+                await self.emit_progress(job)
+                
+                metadata = await generate_playlist_metadata(job['playlistId'], job['source'], job['requestedBy'])
+                if not metadata:
+                    raise Exception("No songs found in the playlist.")
+                
+                job['total'] = len(metadata)
+                await self.emit_progress(job)
+                
+                if on_metadata:
+                    on_metadata(metadata)
+                
+                job['added'] = persist(metadata)
+                job['processed'] = len(metadata)
+                
+                job['status'] = 'completed'
+                logger.info(f"Playlist import {job['id']} completed: {job['added']}/{job['total']} songs added")
+            except Exception as error:
+                job['status'] = 'failed'
+                job['error'] = str(error)
+                logger.error(f"Playlist import {job['id']} failed: {error}")
+            finally:
+                job['finishedAt'] = datetime.now().isoformat()
+                await self.emit_progress(job)
+    
+    async def emit_progress(self, job: dict):
+        try:
+            await socket_manager.emit('playlistImportProgress', dict(job))
+        except Exception as error:
+            logger.debug(f"Could not emit playlist import progress: {error}")
+    
+    def get_job(self, job_id: str):
+        job = self.jobs.get(job_id)
+        return dict(job) if job else None
+    
+    def prune_finished_jobs(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job['finishedAt']]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self.jobs[job_id]
+
+playlist_import_service = StationLocal(PlaylistImportService)
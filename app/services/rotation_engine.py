@@ -0,0 +1,112 @@
+import random
+from collections import deque
+from app.core.constants import ROTATION_NO_REPEAT_WINDOW, ROTATION_LOOKAHEAD
+from app.managers.default_playlist_index import default_playlist_index
+from app.core.station_context import StationLocal
+
+class RotationEngine:
+    def __init__(self, no_repeat_window: int = ROTATION_NO_REPEAT_WINDOW, lookahead: int = ROTATION_LOOKAHEAD):
+        self.no_repeat_window = no_repeat_window
+        self.lookahead = lookahead
+        self.genre = None
+        self.source = None
+        self.entries_by_playlist = {}
+        self.bags = {}
+        self.playlist_ids = []
+        self.cum_weights = []
+        self.upcoming = deque()
+        self.recent = deque()
+        self.recent_counts = {}
+        self.max_draw_attempts = 8
+    
+    def sync(self, genre):
+        candidates = default_playlist_index.get_candidates(genre)
+        if genre == self.genre and candidates is self.source:
+            return candidates
+        
+        self.genre = genre
+        self.source = candidates
+        previous_entries = self.entries_by_playlist
+        self.entries_by_playlist = {}
+        for entry in candidates:
+            self.entries_by_playlist.setdefault(entry.get('playlistId'), []).append(entry)
+        
+        unchanged = {
+            playlist_id
+            for playlist_id, entries in self.entries_by_playlist.items()
+            if previous_entries.get(playlist_id) == entries
+        }
+        self.bags = {playlist_id: bag for playlist_id, bag in self.bags.items() if playlist_id in unchanged}
+        self.playlist_ids = list(self.entries_by_playlist)
+        self.cum_weights = []
+        total = 0
+        for playlist_id in self.playlist_ids:
+            entries = self.entries_by_playlist[playlist_id]
+            total += len(entries) * default_playlist_index.get_weight(entries[0])
+            self.cum_weights.append(total)
+        
+        self.upcoming = deque(track for track in self.upcoming if track.get('playlistId') in unchanged)
+        return candidates
+    
+    def get_window(self) -> int:
+        return min(self.no_repeat_window, len(self.source) // 2)
+    
+    def remember(self, track: dict):
+        key = track.get('url')
+        self.recent.append(key)
+        self.recent_counts[key] = self.recent_counts.get(key, 0) + 1
+        
+        while len(self.recent) > self.get_window():
+            oldest = self.recent.popleft()
+            self.recent_counts[oldest] -= 1
+            if self.recent_counts[oldest] == 0:
+                del self.recent_counts[oldest]
+    
+    def get_bag(self, playlist_id) -> deque:
+        bag = self.bags.get(playlist_id)
+        if not bag:
+            entries = list(self.entries_by_playlist[playlist_id])
+            random.shuffle(entries)
+            bag = deque(entries)
+            self.bags[playlist_id] = bag
+        return bag
+    
+    def draw(self):
+        if not self.playlist_ids:
+            return None
+        
+        for _ in range(self.max_draw_attempts):
+            playlist_id = random.choices(self.playlist_ids, cum_weights=self.cum_weights)[0]
+            bag = self.get_bag(playlist_id)
+            track = bag.pop()
+            
+            if track.get('url') not in self.recent_counts:
+                self.remember(track)
+                return track
+            
+            bag.appendleft(track)
+        
+        track = self.get_bag(playlist_id).pop()
+        self.remember(track)
+        return track
+    
+    def fill_upcoming(self, count: int):
+        while len(self.upcoming) < count:
+            track = self.draw()
+            if not track:
+                break
+            self.upcoming.append(track)
+    
+    def next(self, genre=None):
+        self.sync(genre)
+        self.fill_upcoming(self.lookahead + 1)
+        if not self.upcoming:
+            return None
+        return self.upcoming.popleft()
+    
+    def peek(self, genre=None, count: int = ROTATION_LOOKAHEAD) -> list:
+        self.sync(genre)
+        self.fill_upcoming(count)
+        return list(self.upcoming)[:count]
+
+rotation_engine = StationLocal(RotationEngine)
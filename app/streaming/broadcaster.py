@@ -0,0 +1,64 @@
+import uuid
+from collections import deque
+from io import BytesIO
+from typing import Dict
+from app.core import logger
+from app.core.constants import STREAM_BURST_DURATION
+from app.streaming.mp3_frames import split_frames
+
+class Broadcaster:
+    def __init__(self, bitrate: int, burst_duration: float = STREAM_BURST_DURATION, max_lag_bytes: int = 0, lag_policy: str = 'fastforward'):
+        self.bitrate = bitrate
+        self.clients: Dict[str, BytesIO] = {}
+        self.max_lag_bytes = max_lag_bytes
+        self.lag_policy = lag_policy
+        self.burst_duration = burst_duration
+        self.burst_frames = deque()
+        self.burst_frames_duration = 0.0
+        self.pending = b''
+    
+    def add_client(self) -> dict:
+        client_id = str(uuid.uuid4())
+        stream_buffer = BytesIO()
+        stream_buffer.write(self.get_burst())
+        self.clients[client_id] = stream_buffer
+        return {'id': client_id, 'client': stream_buffer}
+    
+    def remove_client(self, client_id: str) -> bool:
+        return self.clients.pop(client_id, None) is not None
+    
+    def get_burst(self) -> bytes:
+        return b''.join(frame for frame, _ in self.burst_frames) + self.pending
+    
+    def remember(self, chunk: bytes):
+        frames, self.pending = split_frames(self.pending + chunk)
+        
+        for frame, duration in frames:
+            self.burst_frames.append((frame, duration))
+            self.burst_frames_duration += duration
+        
+        while self.burst_frames and self.burst_frames_duration - self.burst_frames[0][1] >= self.burst_duration:
+            _, duration = self.burst_frames.popleft()
+            self.burst_frames_duration -= duration
+    
+    def write(self, chunk: bytes):
+        self.remember(chunk)
+        
+        for client_id, client in list(self.clients.items()):
+            try:
+                client.write(chunk)
+                if self.max_lag_bytes and client.tell() > self.max_lag_bytes:
+                    self.handle_lagging_client(client_id, client)
+            except:
+                pass
+    
+    def handle_lagging_client(self, client_id: str, client: BytesIO):
+        if self.lag_policy == 'disconnect':
+            self.clients.pop(client_id, None)
+            logger.warn(f"Disconnected lagging client: {client_id} ({client.tell()} bytes behind)")
+            return
+        
+        client.seek(0)
+        client.truncate()
+        client.write(self.get_burst())
+        logger.warn(f"Fast-forwarded lagging client: {client_id}")
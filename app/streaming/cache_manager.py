@@ -2,12 +2,14 @@ import os
 from pathlib import Path
 from app.core import logger
 from app.core.fs_helper import fs_helper
-from app.core.constants import CACHE_SIZE, DEFAULT_CACHE_LOCATION, DEFAULT_TRACKS_LOCATION
+from app.core.constants import CACHE_SIZE, DEFAULT_CACHE_LOCATION, DEFAULT_TRACKS_LOCATION, AUDIO_FILE_EXTENSIONS
+from app.streaming.mp3_frames import FrameIndex
 
 class CacheManager:
     def __init__(self, cache_dir: str = DEFAULT_CACHE_LOCATION, max_cache_size: int = CACHE_SIZE):
         self.cache_dir = cache_dir.replace('\\', '/')
         self.max_cache_size = max_cache_size
+        self.pins = {}
         self.ensure_cache_directory()
     
     def ensure_cache_directory(self):
@@ -15,17 +17,30 @@ class CacheManager:
             fs_helper.create_directory(self.cache_dir)
             logger.info(f"Created cache directory at {self.cache_dir}")
     
-    def get_cached_path(self, title: str) -> str:
+    def get_cached_path(self, title: str, extension: str = '.mp3') -> str:
         safe_title = title.replace('<', '').replace('>', '').replace(':', '').replace('"', '').replace('/', '').replace('\\', '').replace('|', '').replace('?', '').replace('*', '')
-        return os.path.join(self.cache_dir, f"{safe_title}.mp3").replace('\\', '/')
+        return os.path.join(self.cache_dir, f"{safe_title}{extension}").replace('\\', '/')
     
-    def get_original_path(self, title: str) -> str:
+    def get_original_path(self, title: str, extension: str = '.mp3') -> str:
         safe_title = title.replace('<', '').replace('>', '').replace(':', '').replace('"', '').replace('/', '').replace('\\', '').replace('|', '').replace('?', '').replace('*', '')
-        return os.path.join(DEFAULT_TRACKS_LOCATION, f"{safe_title}.mp3").replace('\\', '/')
+        return os.path.join(DEFAULT_TRACKS_LOCATION, f"{safe_title}{extension}").replace('\\', '/')
+    
+    def find_cached_path(self, title: str):
+        for extension in AUDIO_FILE_EXTENSIONS:
+            cached_path = self.get_cached_path(title, extension)
+            if fs_helper.exists(cached_path):
+                return cached_path
+        return None
+    
+    def find_original_path(self, title: str):
+        for extension in AUDIO_FILE_EXTENSIONS:
+            original_path = self.get_original_path(title, extension)
+            if fs_helper.exists(original_path):
+                return original_path
+        return None
     
     def is_cached(self, title: str) -> bool:
-        cached_path = self.get_cached_path(title)
-        exists = fs_helper.exists(cached_path)
+        exists = self.find_cached_path(title) is not None
         if exists:
             logger.info(f"Found {title} in cache")
         return exists
@@ -33,7 +48,7 @@ class CacheManager:
     def move_to_cache(self, source_path: str, title: str) -> bool:
         try:
             source_path = source_path.replace('\\', '/')
-            cached_path = self.get_cached_path(title)
+            cached_path = self.get_cached_path(title, os.path.splitext(source_path)[1] or '.mp3')
             
             logger.info(f"Attempting to move {source_path} to {cached_path}")
             
@@ -43,6 +58,10 @@ class CacheManager:
                 fs_helper.copy(source_path, cached_path)
                 logger.info(f"Successfully copied file to cache at {cached_path}")
                 
+                index_path = FrameIndex.get_index_path(source_path)
+                if fs_helper.exists(index_path):
+                    fs_helper.rename(index_path, FrameIndex.get_index_path(cached_path))
+                
                 try:
                     fs_helper.delete(source_path)
                     logger.info(f"Successfully deleted original file at {source_path}")
@@ -58,9 +77,31 @@ class CacheManager:
             logger.error(f"Error moving file to cache: {str(error)}")
             return False
     
+    def pin(self, path: str):
+        if not path:
+            return
+        path = path.replace('\\', '/')
+        self.pins[path] = self.pins.get(path, 0) + 1
+    
+    def unpin(self, path: str):
+        if not path:
+            return
+        path = path.replace('\\', '/')
+        if path in self.pins:
+            self.pins[path] -= 1
+            if self.pins[path] <= 0:
+                del self.pins[path]
+    
+    def is_pinned(self, path: str) -> bool:
+        return path.replace('\\', '/') in self.pins
+    
+    def get_pin_count(self, path: str) -> int:
+        return self.pins.get(path.replace('\\', '/'), 0)
+    
     def get_from_cache(self, title: str):
-        cached_path = self.get_cached_path(title)
-        if self.is_cached(title):
+        cached_path = self.find_cached_path(title)
+        if cached_path:
+            logger.info(f"Found {title} in cache")
             logger.info(f"Using cached version of {title} from {cached_path}")
             return cached_path
         logger.info(f"{title} not found in cache")
@@ -78,7 +119,9 @@ class CacheManager:
             
             file_details = []
             for file in files:
-                file_path = os.path.join(self.cache_dir, file)
+                file_path = os.path.join(self.cache_dir, file).replace('\\', '/')
+                if file.endswith('.idx'):
+                    continue
                 stats = os.stat(file_path)
                 file_details.append({
                     'path': file_path,
@@ -93,9 +136,14 @@ class CacheManager:
             
             while total_size > self.max_cache_size and len(file_details) > 0:
                 oldest_file = file_details.pop(0)
+                if self.is_pinned(oldest_file['path']):
+                    continue
                 try:
                     fs_helper.delete(oldest_file['path'])
                     total_size -= oldest_file['size']
+                    index_path = FrameIndex.get_index_path(oldest_file['path'])
+                    if fs_helper.exists(index_path):
+                        fs_helper.delete(index_path)
                     logger.info(f"Removed {os.path.basename(oldest_file['path'])} from cache due to size limit")
                 except Exception as error:
                     logger.error(f"Failed to remove old cache file {oldest_file['path']}: {str(error)}")
@@ -1,23 +1,78 @@
 import yt_dlp as ytdl
-import aiohttp
 import asyncio
 import subprocess
 import os
 from pathlib import Path
+from urllib.parse import urlparse
+from typing import Dict
 from app.core import logger
-from app.core.utils import get_ffmpeg_path, get_cookies_path
+from app.core.config import config
+from app.core.utils import get_ffmpeg_path
 from app.core.constants import DEFAULT_TRACKS_LOCATION
 from app.core.fs_helper import fs_helper
+from app.core.http_client import http_client
 from app.core.crypto import create_download_links
 from app.streaming.cache_manager import cache_manager
+from app.services.cookie_service import cookie_service
 
 class Downloader:
+    in_flight: Dict[str, asyncio.Task] = {}
+    
+    async def coalesce(self, title: str, download_function):
+        key = cache_manager.get_original_path(title)
+        
+        task = Downloader.in_flight.get(key)
+        if task:
+            logger.info(f"Waiting for in-progress download of: {title}")
+            return await asyncio.shield(task)
+        
+        task = asyncio.create_task(download_function())
+        Downloader.in_flight[key] = task
+        
+        def release(done_task):
+            if Downloader.in_flight.get(key) is done_task:
+                del Downloader.in_flight[key]
+        
+        task.add_done_callback(release)
+        return await asyncio.shield(task)
+    
     async def download_video(self, url: str, title: str, output_path: str = DEFAULT_TRACKS_LOCATION):
+        return await self.coalesce(title, lambda: self._download_video(url, title, output_path))
+    
+    def get_format_options(self, output_file_path: str) -> dict:
+        if config.DOWNLOAD_AUDIO_FORMAT == 'original':
+            return {
+                'format': 'bestaudio/best',
+                'outtmpl': f"{os.path.splitext(output_file_path)[0]}.%(ext)s",
+            }
+        
+        return {
+            'format': 'bestaudio/best',
+            'outtmpl': output_file_path,
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'mp3',
+                'preferredquality': '192',
+            }],
+        }
+    
+    def get_downloaded_path(self, ydl, info: dict) -> str:
+        requested_downloads = info.get('requested_downloads') or []
+        if requested_downloads and requested_downloads[0].get('filepath'):
+            return requested_downloads[0]['filepath'].replace('\\', '/')
+        return ydl.prepare_filename(info).replace('\\', '/')
+    
+    async def _download_video(self, url: str, title: str, output_path: str = DEFAULT_TRACKS_LOCATION):
         cached_path = cache_manager.get_from_cache(title)
         if cached_path:
             logger.info(f"Using cached version of: {title}")
             return {'url': cached_path}
         
+        downloaded_path = cache_manager.find_original_path(title)
+        if downloaded_path:
+            logger.info(f"Using previously downloaded file for: {title}")
+            return {'url': downloaded_path}
+        
         if not fs_helper.exists(output_path):
             fs_helper.create_directory(output_path)
             logger.info(f"Created directory: {output_path}")
@@ -26,36 +81,14 @@ class Downloader:
         logger.info(f"Downloading {title} to {output_file_path}")
         
         try:
-            cookies_path = get_cookies_path()
-            
-            use_cookies = False
-            if os.path.exists(cookies_path):
-                with open(cookies_path, 'r') as f:
-                    cookies_content = f.read()
-                    cookie_lines = [
-                        line for line in cookies_content.split('\n')
-                        if line.strip() and not line.startswith('#') and '.youtube.com' in line
-                    ]
-                    
-                    if len(cookie_lines) > 0:
-                        logger.info(f"Found {len(cookie_lines)} YouTube cookies, will try with cookies first")
-                        use_cookies = True
-                    else:
-                        logger.warn('No valid YouTube cookies found in cookies.txt')
-            else:
-                logger.warn('No cookies.txt file found')
+            cookies_path = cookie_service.get_path()
+            use_cookies = cookie_service.has_youtube_cookies()
             
             download_methods = [
                 {
                     'name': 'without cookies',
                     'options': {
-                        'format': 'bestaudio/best',
-                        'outtmpl': output_file_path,
-                        'postprocessors': [{
-                            'key': 'FFmpegExtractAudio',
-                            'preferredcodec': 'mp3',
-                            'preferredquality': '192',
-                        }],
+                        **self.get_format_options(output_file_path),
                         'ffmpeg_location': get_ffmpeg_path(),
                         'quiet': True,
                         'no_warnings': True,
@@ -67,13 +100,7 @@ class Downloader:
                 download_methods.append({
                     'name': 'with cookies',
                     'options': {
-                        'format': 'bestaudio/best',
-                        'outtmpl': output_file_path,
-                        'postprocessors': [{
-                            'key': 'FFmpegExtractAudio',
-                            'preferredcodec': 'mp3',
-                            'preferredquality': '192',
-                        }],
+                        **self.get_format_options(output_file_path),
                         'cookiefile': cookies_path,
                         'ffmpeg_location': get_ffmpeg_path(),
                         'quiet': True,
@@ -84,12 +111,15 @@ class Downloader:
             download_successful = False
             last_error = None
             
-            for method in download_methods:
+            for method in cookie_service.order_methods(url, download_methods):
                 try:
                     logger.info(f"Attempting download of {title} {method['name']}")
                     with ytdl.YoutubeDL(method['options']) as ydl:
-                        await asyncio.to_thread(ydl.download, [url])
+                        info = await asyncio.to_thread(ydl.extract_info, url, True)
+                        if config.DOWNLOAD_AUDIO_FORMAT == 'original':
+                            output_file_path = self.get_downloaded_path(ydl, info)
                     logger.info(f"Successfully downloaded {title} using {method['name']}")
+                    cookie_service.record_success(url, method['name'])
                     download_successful = True
                     break
                 except Exception as error:
@@ -107,11 +137,19 @@ class Downloader:
             raise error
     
     async def download_from_url(self, url: str, title: str, output_path: str = DEFAULT_TRACKS_LOCATION):
+        return await self.coalesce(title, lambda: self._download_from_url(url, title, output_path))
+    
+    async def _download_from_url(self, url: str, title: str, output_path: str = DEFAULT_TRACKS_LOCATION):
         cached_path = cache_manager.get_from_cache(title)
         if cached_path:
             logger.info(f"Using cached version of: {title}")
             return {'url': cached_path}
         
+        downloaded_path = cache_manager.find_original_path(title)
+        if downloaded_path:
+            logger.info(f"Using previously downloaded file for: {title}")
+            return {'url': downloaded_path}
+        
         if not fs_helper.exists(output_path):
             fs_helper.create_directory(output_path)
             logger.info(f"Created directory: {output_path}")
@@ -124,22 +162,27 @@ class Downloader:
         try:
             logger.info(f"Downloading {title} from URL to {output_file_path}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    with open(temp_file, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            f.write(chunk)
+            session = http_client.get_session()
+            async with session.get(url) as response:
+                with open(temp_file, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(8192):
+                        f.write(chunk)
             
-            ffmpeg_path = get_ffmpeg_path()
-            process = await asyncio.create_subprocess_exec(
-                ffmpeg_path, '-i', temp_file,
-                '-acodec', 'libmp3lame',
-                '-aq', '6',
-                output_file_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await process.communicate()
+            if config.DOWNLOAD_AUDIO_FORMAT == 'original':
+                extension = os.path.splitext(urlparse(url).path)[1] or '.m4a'
+                output_file_path = cache_manager.get_original_path(title, extension)
+                fs_helper.rename(temp_file, output_file_path)
+            else:
+                ffmpeg_path = get_ffmpeg_path()
+                process = await asyncio.create_subprocess_exec(
+                    ffmpeg_path, '-i', temp_file,
+                    '-acodec', 'libmp3lame',
+                    '-aq', '6',
+                    output_file_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                await process.communicate()
             
             if fs_helper.exists(temp_file):
                 fs_helper.delete(temp_file)
@@ -0,0 +1,67 @@
+import math
+import struct
+from collections import deque
+from typing import Optional
+from app.core.constants import HLS_SEGMENT_DURATION, HLS_WINDOW_SIZE
+from app.streaming.mp3_frames import split_frames
+
+TIMESTAMP_OWNER = b'com.apple.streaming.transportStreamTimestamp\x00'
+
+def syncsafe(size: int) -> bytes:
+    return bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+
+def build_timestamp_tag(seconds: float) -> bytes:
+    payload = TIMESTAMP_OWNER + struct.pack('>Q', int(seconds * 90000) & 0x1FFFFFFFF)
+    frame = b'PRIV' + syncsafe(len(payload)) + b'\x00\x00' + payload
+    return b'ID3\x04\x00\x00' + syncsafe(len(frame)) + frame
+
+class HlsSegmenter:
+    def __init__(self, segment_duration: float = HLS_SEGMENT_DURATION, window_size: int = HLS_WINDOW_SIZE):
+        self.segment_duration = segment_duration
+        self.segments = deque(maxlen=window_size)
+        self.pending = b''
+        self.current = bytearray()
+        self.current_duration = 0.0
+        self.sequence = 0
+        self.timestamp = 0.0
+    
+    def feed(self, chunk: bytes):
+        frames, self.pending = split_frames(self.pending + chunk)
+        for frame, duration in frames:
+            self.current.extend(frame)
+            self.current_duration += duration
+            if self.current_duration >= self.segment_duration:
+                self.finish_segment()
+    
+    def finish_segment(self):
+        self.segments.append({
+            'sequence': self.sequence,
+            'duration': self.current_duration,
+            'data': build_timestamp_tag(self.timestamp) + bytes(self.current)
+        })
+        self.timestamp += self.current_duration
+        self.sequence += 1
+        self.current = bytearray()
+        self.current_duration = 0.0
+    
+    def get_playlist(self) -> str:
+        segments = list(self.segments)
+        target_duration = math.ceil(max([segment['duration'] for segment in segments] + [self.segment_duration]))
+        lines = [
+            '#EXTM3U',
+            '#EXT-X-VERSION:3',
+            f"#EXT-X-TARGETDURATION:{target_duration}",
+            f"#EXT-X-MEDIA-SEQUENCE:{segments[0]['sequence'] if segments else self.sequence}"
+        ]
+        for segment in segments:
+            lines.append(f"#EXTINF:{segment['duration']:.3f},")
+            lines.append(f"segment_{segment['sequence']}.mp3")
+        return '\n'.join(lines) + '\n'
+    
+    def get_segment(self, sequence: int) -> Optional[bytes]:
+        if not self.segments:
+            return None
+        index = sequence - self.segments[0]['sequence']
+        if index < 0 or index >= len(self.segments):
+            return None
+        return self.segments[index]['data']
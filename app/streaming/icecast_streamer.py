@@ -1,7 +1,10 @@
 import asyncio
-import subprocess
+import base64
+import aiohttp
+from collections import deque
 from app.core import logger
-from app.core.utils import get_ffmpeg_path
+from app.core.constants import ICECAST_RECONNECT_BACKLOG, ICECAST_RECONNECT_COOLDOWN
+from app.core.http_client import http_client
 
 class IcecastStreamer:
     def __init__(self, config: dict):
@@ -15,84 +18,110 @@ class IcecastStreamer:
             'genre': config.get('genre', 'Various'),
             'bitrate': config.get('bitrate', '128'),
             'sampleRate': config.get('sampleRate', '44100'),
-            'channels': config.get('channels', '2')
+            'channels': config.get('channels', '2'),
+            'method': (config.get('method') or 'PUT').upper()
         }
         
-        self.ffmpeg_process = None
+        self.reader = None
+        self.writer = None
         self.is_connected = False
+        self.is_connecting = False
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 10
         self.reconnect_delay = 5
-        self.reconnect_timer = None
+        self.reconnect_cooldown = ICECAST_RECONNECT_COOLDOWN
+        self.connect_timeout = 10
         self.is_reconnecting = False
-        self.buffer = []
+        self.buffer = deque()
         self.buffer_size = 0
         self.max_buffer_size = 1024 * 1024
-        self.connection_promise = None
+        self.reconnect_backlog_size = int(self.config['bitrate']) * 1000 // 8 * ICECAST_RECONNECT_BACKLOG
+        self.dropped_bytes = 0
+        self.data_available = asyncio.Event()
+        self.writer_task = None
+        self.current_title = None
     
-    async def connect(self):
-        if self.connection_promise:
-            return await self.connection_promise
+    def get_credentials(self) -> str:
+        return base64.b64encode(f"source:{self.config['password']}".encode('utf-8')).decode('ascii')
+    
+    def build_handshake(self) -> bytes:
+        method = self.config['method']
+        lines = [
+            f"{method} {self.config['mount']} HTTP/{'1.1' if method == 'PUT' else '1.0'}",
+            f"Host: {self.config['host']}:{self.config['port']}",
+            f"Authorization: Basic {self.get_credentials()}",
+            'User-Agent: MRadio',
+            'Content-Type: audio/mpeg',
+            f"Ice-Name: {self.config['name']}",
+            f"Ice-Description: {self.config['description']}",
+            f"Ice-Genre: {self.config['genre']}",
+            'Ice-Public: 1',
+            f"Ice-Audio-Info: bitrate={self.config['bitrate']};samplerate={self.config['sampleRate']};channels={self.config['channels']}"
+        ]
+        if method == 'PUT':
+            lines.append('Expect: 100-continue')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('utf-8')
+    
+    async def read_response(self, reader) -> int:
+        status_line = (await reader.readline()).decode('latin-1').split()
+        status = int(status_line[1]) if len(status_line) > 1 and status_line[1].isdigit() else 0
+        
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
         
+        return status
+    
+    async def connect(self):
         if self.is_connected:
             logger.info('Already connected to Icecast server')
             return
         
-        if self.is_reconnecting:
-            logger.info('Already attempting to reconnect to Icecast server')
+        if self.is_reconnecting or self.is_connecting:
+            logger.info('Already attempting to connect to Icecast server')
             return
         
-        icecast_url = f"icecast://source:{self.config['password']}@{self.config['host']}:{self.config['port']}{self.config['mount']}"
+        self.is_connecting = True
+        failed = False
         
         logger.info(f"Connecting to Icecast server at {self.config['host']}:{self.config['port']}{self.config['mount']}")
         
-        ffmpeg_args = [
-            get_ffmpeg_path(),
-            '-hide_banner',
-            '-loglevel', 'warning',
-            '-f', 'mp3',
-            '-i', 'pipe:0',
-            '-err_detect', 'ignore_err',
-            '-fflags', '+genpts+discardcorrupt',
-            '-max_error_rate', '1.0',
-            '-acodec', 'libmp3lame',
-            '-ab', f"{self.config['bitrate']}k",
-            '-ar', self.config['sampleRate'],
-            '-ac', self.config['channels'],
-            '-metadata', f"title={self.config['name']}",
-            '-metadata', f"artist={self.config['description']}",
-            '-metadata', f"genre={self.config['genre']}",
-            '-f', 'mp3',
-            '-content_type', 'audio/mpeg',
-            '-ice_name', self.config['name'],
-            '-ice_description', self.config['description'],
-            '-ice_genre', self.config['genre'],
-            '-ice_public', '1',
-            icecast_url
-        ]
-        
         try:
-            self.ffmpeg_process = subprocess.Popen(
-                ffmpeg_args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.config['host'], int(self.config['port'])),
+                timeout=self.connect_timeout
             )
+            self.reader, self.writer = reader, writer
             
-            self.flush_buffer()
+            writer.write(self.build_handshake())
+            await writer.drain()
             
-            await asyncio.sleep(2)
+            status = await asyncio.wait_for(self.read_response(reader), timeout=self.connect_timeout)
+            if status not in (100, 200):
+                raise ConnectionError(f"Icecast rejected source connection with status {status}")
             
-            if self.ffmpeg_process and self.ffmpeg_process.poll() is None:
-                self.is_connected = True
-                self.is_reconnecting = False
-                self.reconnect_attempts = 0
-                logger.info('FFmpeg Icecast streaming initialized')
+            self.is_connected = True
+            self.is_reconnecting = False
+            self.reconnect_attempts = 0
+            self.trim_buffer(self.reconnect_backlog_size)
+            self.writer_task = asyncio.create_task(self.run_writer(writer))
+            if self.buffer:
+                self.data_available.set()
+            logger.info('Icecast source connection established')
             
+            if self.current_title:
+                asyncio.create_task(self.update_metadata(self.current_title))
+        
         except Exception as error:
-            logger.error(f'FFmpeg process error: {str(error)}')
-            if not self.is_reconnecting:
-                await self.handle_connection_error()
+            logger.error(f'Icecast connection error: {str(error)}')
+            self.cleanup()
+            failed = True
+        finally:
+            self.is_connecting = False
+        
+        if failed:
+            await self.handle_connection_error()
     
     async def handle_connection_error(self):
         if self.is_reconnecting:
@@ -103,7 +132,12 @@ class IcecastStreamer:
         if self.reconnect_attempts < self.max_reconnect_attempts:
             await self.schedule_reconnect()
         else:
-            logger.error('Max reconnection attempts reached for Icecast')
+            logger.error(f"Max reconnection attempts reached for Icecast, retrying in {self.reconnect_cooldown}s")
+            asyncio.create_task(self.reset_after_cooldown())
+    
+    async def reset_after_cooldown(self):
+        await asyncio.sleep(self.reconnect_cooldown)
+        self.reconnect_attempts = 0
     
     async def schedule_reconnect(self):
         if self.is_reconnecting:
@@ -126,72 +160,96 @@ class IcecastStreamer:
             logger.error(f'Icecast reconnection failed: {str(err)}')
             self.is_reconnecting = False
     
-    def flush_buffer(self):
-        if len(self.buffer) > 0 and self.ffmpeg_process and self.ffmpeg_process.stdin:
-            try:
-                for chunk in self.buffer:
-                    self.ffmpeg_process.stdin.write(chunk)
-                self.ffmpeg_process.stdin.flush()
-                self.buffer = []
-                self.buffer_size = 0
-                logger.debug('Flushed audio buffer to stream')
-            except Exception as error:
-                logger.error(f'Error flushing buffer: {str(error)}')
+    async def run_writer(self, writer):
+        while self.is_connected and not writer.is_closing():
+            await self.data_available.wait()
+            self.data_available.clear()
+            
+            while self.buffer:
+                chunk = self.buffer.popleft()
+                self.buffer_size -= len(chunk)
+                
+                try:
+                    writer.write(chunk)
+                    await writer.drain()
+                except Exception as error:
+                    logger.error(f'Error writing to Icecast stream: {str(error)}')
+                    self.buffer.appendleft(chunk)
+                    self.buffer_size += len(chunk)
+                    self.writer_task = None
+                    self.cleanup()
+                    await self.handle_connection_error()
+                    return
     
     def write(self, chunk: bytes):
         if not chunk or len(chunk) == 0:
             return
         
-        if self.is_connected and self.ffmpeg_process and self.ffmpeg_process.stdin:
-            try:
-                if len(self.buffer) > 0:
-                    self.flush_buffer()
-                
-                self.ffmpeg_process.stdin.write(chunk)
-                self.ffmpeg_process.stdin.flush()
-            except Exception as error:
-                logger.error(f'Error writing to Icecast stream: {str(error)}')
-                self.add_to_buffer(chunk)
-                if not self.is_reconnecting:
-                    asyncio.create_task(self.handle_connection_error())
-        else:
-            self.add_to_buffer(chunk)
-            
-            if not self.is_connected and not self.is_reconnecting and self.reconnect_attempts == 0:
-                asyncio.create_task(self.connect())
+        self.add_to_buffer(chunk)
+        self.data_available.set()
+        
+        if not self.is_connected and not self.is_reconnecting and not self.is_connecting and self.reconnect_attempts == 0:
+            asyncio.create_task(self.connect())
     
     def add_to_buffer(self, chunk: bytes):
-        if self.buffer_size + len(chunk) <= self.max_buffer_size:
-            self.buffer.append(chunk)
-            self.buffer_size += len(chunk)
-        else:
-            while self.buffer_size + len(chunk) > self.max_buffer_size and len(self.buffer) > 0:
-                removed = self.buffer.pop(0)
-                self.buffer_size -= len(removed)
-            self.buffer.append(chunk)
-            self.buffer_size += len(chunk)
+        self.buffer.append(chunk)
+        self.buffer_size += len(chunk)
+        self.trim_buffer(self.max_buffer_size)
+    
+    def trim_buffer(self, max_size: int):
+        while self.buffer_size > max_size and len(self.buffer) > 1:
+            removed = self.buffer.popleft()
+            self.buffer_size -= len(removed)
+            self.dropped_bytes += len(removed)
+    
+    async def update_metadata(self, title: str):
+        self.current_title = title
+        
+        if not self.is_connected:
+            return
+        
+        url = f"http://{self.config['host']}:{self.config['port']}/admin/metadata"
+        params = {
+            'mount': self.config['mount'],
+            'mode': 'updinfo',
+            'song': title,
+            'charset': 'UTF-8'
+        }
+        
+        try:
+            async with http_client.get_session().get(
+                url,
+                params=params,
+                auth=aiohttp.BasicAuth('source', self.config['password']),
+                timeout=aiohttp.ClientTimeout(total=self.connect_timeout)
+            ) as response:
+                if response.status != 200:
+                    logger.warn(f"Icecast metadata update failed with status {response.status}")
+        except Exception as error:
+            logger.warn(f"Icecast metadata update failed: {str(error)}")
     
     def cleanup(self):
-        if self.ffmpeg_process:
+        if self.writer_task and self.writer_task is not asyncio.current_task():
+            self.writer_task.cancel()
+        self.writer_task = None
+        
+        if self.writer:
             try:
-                if self.ffmpeg_process.stdin:
-                    self.ffmpeg_process.stdin.close()
-                self.ffmpeg_process.terminate()
-                self.ffmpeg_process.wait(timeout=5)
+                self.writer.close()
             except Exception as error:
-                logger.debug(f'Error cleaning up FFmpeg process: {str(error)}')
-            self.ffmpeg_process = None
+                logger.debug(f'Error closing Icecast connection: {str(error)}')
+        
+        self.reader = None
+        self.writer = None
+        self.is_connected = False
     
     def disconnect(self):
-        if self.reconnect_timer:
-            self.reconnect_timer = None
-        
         self.cleanup()
         
         self.is_connected = False
         self.is_reconnecting = False
         self.reconnect_attempts = 0
-        self.buffer = []
+        self.buffer.clear()
         self.buffer_size = 0
         
         logger.info('Disconnected from Icecast server')
@@ -202,6 +260,7 @@ class IcecastStreamer:
             'reconnecting': self.is_reconnecting,
             'reconnectAttempts': self.reconnect_attempts,
             'bufferSize': self.buffer_size,
+            'droppedBytes': self.dropped_bytes,
             'config': {
                 'host': self.config['host'],
                 'port': self.config['port'],
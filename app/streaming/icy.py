@@ -0,0 +1,38 @@
+import math
+from app.core.constants import ICY_METAINT
+
+def build_metadata_block(title: str) -> bytes:
+    title = title.replace("'", '\u2019').replace(';', ',')
+    title = title.encode('utf-8')[:4000].decode('utf-8', 'ignore')
+    text = f"StreamTitle='{title}';".encode('utf-8')
+    length = math.ceil(len(text) / 16)
+    return bytes([length]) + text.ljust(length * 16, b'\x00')
+
+class IcyMetadataInjector:
+    def __init__(self, get_block, metaint: int = ICY_METAINT):
+        self.get_block = get_block
+        self.metaint = metaint
+        self.bytes_until_metadata = metaint
+        self.last_block = None
+    
+    def inject(self, data: bytes) -> bytes:
+        parts = []
+        position = 0
+        
+        while len(data) - position >= self.bytes_until_metadata:
+            end = position + self.bytes_until_metadata
+            parts.append(data[position:end])
+            
+            block = self.get_block()
+            if block is self.last_block:
+                parts.append(b'\x00')
+            else:
+                parts.append(block)
+                self.last_block = block
+            
+            position = end
+            self.bytes_until_metadata = self.metaint
+        
+        parts.append(data[position:])
+        self.bytes_until_metadata -= len(data) - position
+        return b''.join(parts)
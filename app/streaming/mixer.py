@@ -0,0 +1,234 @@
+import asyncio
+from typing import Optional
+from app.core import logger
+from app.core.utils import get_ffmpeg_path
+from app.core.constants import STREAM_CHUNK_DURATION, STREAM_READ_AHEAD
+from app.streaming import pcm
+
+class PcmDecoder:
+    def __init__(self, file_path: str, start: float = 0.0, duration: Optional[float] = None):
+        self.file_path = file_path
+        self.start = start
+        self.duration = duration
+        self.position = start
+        self.process = None
+        self.finished = False
+    
+    @property
+    def remaining(self) -> Optional[float]:
+        if not self.duration:
+            return None
+        return self.duration - self.position
+    
+    async def open(self):
+        self.process = await asyncio.create_subprocess_exec(
+            get_ffmpeg_path(),
+            '-ss', str(self.start),
+            '-i', self.file_path,
+            '-vn',
+            '-f', 's16le',
+            '-ar', str(pcm.SAMPLE_RATE),
+            '-ac', str(pcm.CHANNELS),
+            '-',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    
+    async def read(self, size: int) -> bytes:
+        if self.finished or not self.process:
+            return b''
+        
+        try:
+            data = await self.process.stdout.readexactly(size)
+        except asyncio.IncompleteReadError as error:
+            data = error.partial
+            self.finished = True
+        
+        self.position += len(data) / pcm.BYTES_PER_SECOND
+        return data
+    
+    async def close(self):
+        self.finished = True
+        if self.process and self.process.returncode is None:
+            try:
+                self.process.kill()
+                await self.process.wait()
+            except ProcessLookupError:
+                pass
+
+class Mp3Encoder:
+    def __init__(self, bitrate: int, on_output):
+        self.bitrate = bitrate
+        self.on_output = on_output
+        self.process = None
+        self.reader_task = None
+    
+    @property
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+    
+    async def start(self):
+        if self.is_running:
+            return
+        
+        self.process = await asyncio.create_subprocess_exec(
+            get_ffmpeg_path(),
+            '-f', 's16le',
+            '-ar', str(pcm.SAMPLE_RATE),
+            '-ac', str(pcm.CHANNELS),
+            '-i', 'pipe:0',
+            '-f', 'mp3',
+            '-ab', f"{self.bitrate}k",
+            '-id3v2_version', '0',
+            '-write_xing', '0',
+            '-flush_packets', '1',
+            'pipe:1',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        self.reader_task = asyncio.create_task(self.read_output(self.process))
+        logger.info(f"Started persistent MP3 encoder at {self.bitrate}kbps")
+    
+    async def read_output(self, process):
+        while True:
+            chunk = await process.stdout.read(4096)
+            if not chunk:
+                break
+            try:
+                await self.on_output(chunk)
+            except Exception as error:
+                logger.error(f"Error delivering encoded audio: {error}")
+    
+    async def write(self, data: bytes):
+        if not self.is_running:
+            await self.start()
+        self.process.stdin.write(data)
+        await self.process.stdin.drain()
+    
+    async def stop(self):
+        if self.reader_task:
+            self.reader_task.cancel()
+            self.reader_task = None
+        if self.is_running:
+            self.process.kill()
+            await self.process.wait()
+        self.process = None
+
+class CrossfadeMixer:
+    def __init__(self, crossfade: float, bitrates: list, on_output, on_track_ending):
+        self.crossfade = crossfade
+        self.chunk_size = pcm.seconds_to_bytes(STREAM_CHUNK_DURATION)
+        self.encoders = [
+            Mp3Encoder(bitrate, lambda chunk, bitrate=bitrate: on_output(bitrate, chunk))
+            for bitrate in bitrates
+        ]
+        self.on_track_ending = on_track_ending
+        self.current: Optional[PcmDecoder] = None
+        self.outgoing: Optional[PcmDecoder] = None
+        self.fade_size = 0
+        self.fade_position = 0
+        self.ending_requested = False
+        self.task = None
+    
+    async def start(self):
+        if self.task and not self.task.done():
+            return
+        for encoder in self.encoders:
+            await encoder.start()
+        self.task = asyncio.create_task(self.run())
+    
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        await self.fade_to(None, 0)
+        for encoder in self.encoders:
+            await encoder.stop()
+    
+    async def load(self, file_path: str, start: float = 0.0, duration: Optional[float] = None, fade: Optional[float] = None):
+        decoder = PcmDecoder(file_path, start, duration)
+        await decoder.open()
+        await self.fade_to(decoder, self.crossfade if fade is None else fade)
+    
+    async def fade_out(self, fade: Optional[float] = None):
+        await self.fade_to(None, self.crossfade if fade is None else fade)
+    
+    async def fade_to(self, decoder: Optional[PcmDecoder], fade: float):
+        stale = [self.outgoing]
+        
+        self.outgoing = self.current
+        self.current = decoder
+        self.fade_size = pcm.seconds_to_bytes(fade) if self.outgoing else 0
+        self.fade_position = 0
+        self.ending_requested = False
+        
+        if not self.fade_size:
+            stale.append(self.outgoing)
+            self.outgoing = None
+        
+        for stale_decoder in stale:
+            if stale_decoder:
+                await stale_decoder.close()
+    
+    def request_track_end(self):
+        if self.ending_requested:
+            return
+        self.ending_requested = True
+        asyncio.create_task(self.on_track_ending())
+    
+    def mix_fade(self, outgoing_data: bytes, incoming_data: bytes, start_gain: float, end_gain: float) -> bytes:
+        return pcm.mix(
+            pcm.apply_gain_ramp(outgoing_data, 1.0 - start_gain, 1.0 - end_gain),
+            pcm.apply_gain_ramp(incoming_data, start_gain, end_gain)
+        )
+    
+    async def next_chunk(self) -> bytes:
+        current = self.current
+        data = await current.read(self.chunk_size) if current else b''
+        
+        if current and current is self.current:
+            if current.finished:
+                await current.close()
+                self.current = None
+                self.request_track_end()
+            elif self.crossfade and current.remaining is not None and current.remaining <= self.crossfade:
+                self.request_track_end()
+        
+        outgoing = self.outgoing
+        if outgoing:
+            outgoing_data = await outgoing.read(self.chunk_size)
+            start_gain = self.fade_position / self.fade_size
+            self.fade_position += self.chunk_size
+            end_gain = min(1.0, self.fade_position / self.fade_size)
+            
+            data = self.mix_fade(outgoing_data, data, start_gain, end_gain)
+            
+            if (end_gain >= 1.0 or outgoing.finished) and outgoing is self.outgoing:
+                self.outgoing = None
+                await outgoing.close()
+        
+        return data.ljust(self.chunk_size, b'\x00')
+    
+    async def run(self):
+        loop = asyncio.get_event_loop()
+        started_at = loop.time()
+        sent = 0.0
+        
+        while True:
+            try:
+                chunk = await self.next_chunk()
+                for encoder in self.encoders:
+                    await encoder.write(chunk)
+                sent += len(chunk) / pcm.BYTES_PER_SECOND
+                
+                delay = started_at + sent - STREAM_READ_AHEAD - loop.time()
+                if delay < -STREAM_READ_AHEAD:
+                    started_at = loop.time()
+                    sent = 0.0
+                await asyncio.sleep(max(0, delay))
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.error(f"Error in crossfade mixer: {error}")
+                await asyncio.sleep(STREAM_CHUNK_DURATION)
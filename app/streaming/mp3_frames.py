@@ -0,0 +1,248 @@
+import os
+import struct
+from array import array
+from app.core import logger
+
+MPEG1_LAYER3_BITRATES = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+MPEG2_LAYER3_BITRATES = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+SAMPLE_RATES = {
+    3: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    0: [11025, 12000, 8000]
+}
+
+INDEX_MAGIC = b'MRFI'
+INDEX_HEADER = struct.Struct('<4sIQd')
+
+def parse_frame_header(header: bytes):
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    
+    padding = (header[2] >> 1) & 0x01
+    sample_rate = SAMPLE_RATES[version][sample_rate_index]
+    
+    if version == 3:
+        bitrate = MPEG1_LAYER3_BITRATES[bitrate_index] * 1000
+        samples = 1152
+        length = 144 * bitrate // sample_rate + padding
+    else:
+        bitrate = MPEG2_LAYER3_BITRATES[bitrate_index] * 1000
+        samples = 576
+        length = 72 * bitrate // sample_rate + padding
+    
+    return {
+        'length': length,
+        'samples': samples,
+        'sampleRate': sample_rate,
+        'bitrate': bitrate,
+        'duration': samples / sample_rate
+    }
+
+def get_id3v2_size(data: bytes) -> int:
+    if len(data) < 10 or data[:3] != b'ID3':
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+def find_frame(data: bytes, position: int) -> int:
+    while True:
+        position = data.find(b'\xff', position)
+        if position < 0 or position + 4 > len(data):
+            return -1
+        
+        header = parse_frame_header(data[position:position + 4])
+        if header:
+            next_position = position + header['length']
+            if next_position + 4 > len(data) or parse_frame_header(data[next_position:next_position + 4]):
+                return position
+        
+        position += 1
+
+def split_frames(data: bytes):
+    frames = []
+    position = 0
+    
+    while position + 4 <= len(data):
+        header = parse_frame_header(data[position:position + 4])
+        if not header:
+            next_position = find_frame(data, position + 1)
+            if next_position < 0:
+                return frames, data[max(position, len(data) - 3):]
+            position = next_position
+            continue
+        
+        end = position + header['length']
+        if end > len(data):
+            break
+        
+        frames.append((data[position:end], header['duration']))
+        position = end
+    
+    return frames, data[position:]
+
+def measure_frames(data: bytes):
+    duration = 0.0
+    position = 0
+    
+    while position + 4 <= len(data):
+        header = parse_frame_header(data[position:position + 4])
+        if not header:
+            next_position = find_frame(data, position + 1)
+            if next_position < 0:
+                return duration, data[max(position, len(data) - 3):]
+            position = next_position
+            continue
+        
+        end = position + header['length']
+        if end > len(data):
+            break
+        
+        duration += header['duration']
+        position = end
+    
+    return duration, data[position:]
+
+class FrameIndex:
+    def __init__(self, offsets: array, end_offset: int, frame_duration: float):
+        self.offsets = offsets
+        self.end_offset = end_offset
+        self.frame_duration = frame_duration
+    
+    @property
+    def frame_count(self) -> int:
+        return len(self.offsets)
+    
+    @property
+    def duration(self) -> float:
+        return self.frame_count * self.frame_duration
+    
+    def frame_for_time(self, seconds: float) -> int:
+        if self.frame_count == 0:
+            return 0
+        return max(0, min(int(seconds / self.frame_duration), self.frame_count - 1))
+    
+    def get_frame_offset(self, frame_number: int) -> int:
+        if frame_number >= self.frame_count:
+            return self.end_offset
+        return self.offsets[frame_number]
+    
+    @staticmethod
+    def get_index_path(file_path: str) -> str:
+        return f"{file_path}.idx"
+    
+    @staticmethod
+    def build(file_path: str):
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        
+        offsets = array('Q')
+        frame_duration = None
+        position = find_frame(data, get_id3v2_size(data))
+        
+        while 0 <= position and position + 4 <= len(data):
+            header = parse_frame_header(data[position:position + 4])
+            if not header:
+                position = find_frame(data, position + 1)
+                continue
+            
+            if position + header['length'] > len(data):
+                break
+            
+            if frame_duration is None:
+                frame_duration = header['duration']
+            
+            offsets.append(position)
+            position += header['length']
+        
+        if not offsets:
+            return None
+        
+        end_offset = offsets[-1] + parse_frame_header(data[offsets[-1]:offsets[-1] + 4])['length']
+        return FrameIndex(offsets, end_offset, frame_duration)
+    
+    def save(self, index_path: str):
+        temp_path = f"{index_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, self.frame_count, self.end_offset, self.frame_duration))
+            self.offsets.tofile(f)
+        os.replace(temp_path, index_path)
+    
+    @staticmethod
+    def load(index_path: str):
+        with open(index_path, 'rb') as f:
+            magic, frame_count, end_offset, frame_duration = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+            if magic != INDEX_MAGIC:
+                return None
+            offsets = array('Q')
+            offsets.fromfile(f, frame_count)
+        return FrameIndex(offsets, end_offset, frame_duration)
+    
+    @staticmethod
+    def load_or_build(file_path: str):
+        index_path = FrameIndex.get_index_path(file_path)
+        
+        try:
+            if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(file_path):
+                index = FrameIndex.load(index_path)
+                if index:
+                    return index
+        except Exception as error:
+            logger.warn(f"Could not load frame index for {file_path}: {error}")
+        
+        try:
+            index = FrameIndex.build(file_path)
+            if index:
+                index.save(index_path)
+                logger.info(f"Built frame index for {file_path} ({index.frame_count} frames)")
+            return index
+        except Exception as error:
+            logger.error(f"Error building frame index for {file_path}: {error}")
+            return None
+
+class Mp3FrameReader:
+    def __init__(self, file_path: str, index: FrameIndex):
+        self.file_path = file_path
+        self.index = index
+        self.file = open(file_path, 'rb')
+        self.frame_number = 0
+        self.seek_count = 0
+    
+    @property
+    def position(self) -> float:
+        return self.frame_number * self.index.frame_duration
+    
+    def read(self, duration: float):
+        if self.frame_number >= self.index.frame_count:
+            return b'', 0.0
+        
+        frame_count = max(1, int(duration / self.index.frame_duration))
+        end_frame = min(self.frame_number + frame_count, self.index.frame_count)
+        
+        start_offset = self.index.get_frame_offset(self.frame_number)
+        end_offset = self.index.get_frame_offset(end_frame)
+        
+        self.file.seek(start_offset)
+        chunk = self.file.read(end_offset - start_offset)
+        
+        read_duration = (end_frame - self.frame_number) * self.index.frame_duration
+        self.frame_number = end_frame
+        return chunk, read_duration
+    
+    def seek(self, seconds: float):
+        self.frame_number = self.index.frame_for_time(seconds)
+        self.seek_count += 1
+    
+    def close(self):
+        try:
+            self.file.close()
+        except Exception:
+            pass
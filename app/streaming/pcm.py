@@ -0,0 +1,31 @@
+import numpy as np
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+SAMPLE_WIDTH = 2
+BYTES_PER_FRAME = CHANNELS * SAMPLE_WIDTH
+BYTES_PER_SECOND = SAMPLE_RATE * BYTES_PER_FRAME
+
+def seconds_to_bytes(seconds: float) -> int:
+    return int(seconds * SAMPLE_RATE) * BYTES_PER_FRAME
+
+def silence(size: int) -> bytes:
+    return bytes(size - size % BYTES_PER_FRAME)
+
+def apply_gain_ramp(pcm: bytes, start_gain: float, end_gain: float) -> bytes:
+    frame_count = len(pcm) // BYTES_PER_FRAME
+    if frame_count == 0 or (start_gain == 1.0 and end_gain == 1.0):
+        return pcm
+    
+    samples = np.frombuffer(pcm[:frame_count * BYTES_PER_FRAME], dtype='<i2').reshape(-1, CHANNELS)
+    ramp = np.linspace(start_gain, end_gain, frame_count, endpoint=False, dtype=np.float32)[:, None]
+    return np.clip(samples * ramp, -32768, 32767).astype('<i2').tobytes()
+
+def mix(first: bytes, second: bytes) -> bytes:
+    size = max(len(first), len(second))
+    size -= size % SAMPLE_WIDTH
+    first = first[:size].ljust(size, b'\x00')
+    second = second[:size].ljust(size, b'\x00')
+    
+    mixed = np.frombuffer(first, dtype='<i2').astype(np.int32) + np.frombuffer(second, dtype='<i2')
+    return np.clip(mixed, -32768, 32767).astype('<i2').tobytes()
@@ -0,0 +1,17 @@
+from app.streaming.mp3_frames import measure_frames
+
+class PlaybackClock:
+    def __init__(self):
+        self.position = 0.0
+        self.pending = b''
+    
+    def reset(self, position: float = 0.0):
+        self.position = position
+        self.pending = b''
+    
+    def advance(self, seconds: float):
+        self.position += seconds
+    
+    def measure(self, chunk: bytes) -> float:
+        duration, self.pending = measure_frames(self.pending + chunk)
+        return duration
@@ -1,16 +1,26 @@
 import asyncio
 import subprocess
 import os
-from typing import Dict, Optional, List
+from typing import Dict, List, Optional
 from io import BytesIO
-import uuid
-from datetime import datetime
 from app.core import logger
-from app.core.utils import get_ffmpeg_path, duration_formatter
-from app.core.constants import DEFAULT_QUEUE_SIZE, DEFAULT_TRACKS_LOCATION
+from app.core.config import config
+from app.core.utils import get_ffmpeg_path, duration_formatter, duration_to_seconds
+from app.core.constants import (
+    DEFAULT_QUEUE_SIZE, DEFAULT_TRACKS_LOCATION, AUDIO_FILE_EXTENSIONS,
+    STREAM_CHUNK_DURATION, STREAM_READ_AHEAD, SEEK_FADE_DURATION
+)
 from app.streaming.cache_manager import cache_manager
 from app.streaming.icecast_streamer import IcecastStreamer
-from app.streaming.silence_generator import SilenceGenerator
+from app.streaming.broadcaster import Broadcaster
+from app.streaming.hls import HlsSegmenter
+from app.streaming.icy import build_metadata_block
+from app.streaming.mixer import CrossfadeMixer
+from app.streaming.mp3_frames import FrameIndex, Mp3FrameReader
+from app.streaming.playback_clock import PlaybackClock
+from app.streaming.shared_ring import SharedRingBuffer
+from app.streaming.silence_generator import silence_generator
+from app.streaming.track_list import TrackList, TrackRecord
 from app.services.next_track_fetcher import fetch_next_track
 from app.streaming.socket_manager import socket_manager
 
@@ -44,24 +54,61 @@ class PassThrough:
 
 class Queue:
     def __init__(self):
-        self.tracks: List[Dict] = []
-        self.index = 0
-        self.clients: Dict[str, any] = {}
-        self.current_track: Optional[Dict] = None
+        self.track_list = TrackList()
+        self.primary_bitrate = config.STREAM_BITRATE
+        self.bitrate_ladder = sorted(set(config.STREAM_BITRATE_LADDER + [self.primary_bitrate]))
+        self.broadcasters: Dict[int, Broadcaster] = {
+            bitrate: Broadcaster(bitrate, max_lag_bytes=config.LISTENER_MAX_LAG_BYTES, lag_policy=config.LISTENER_LAG_POLICY)
+            for bitrate in self.bitrate_ladder
+        }
+        self.max_listeners = config.MAX_LISTENERS
+        self.max_listeners_per_ip = config.MAX_LISTENERS_PER_IP
+        self.client_ips: Dict[str, Optional[str]] = {}
+        self.listeners_by_ip: Dict[str, int] = {}
+        self.hls_segmenter = HlsSegmenter() if config.HLS_ENABLED else None
+        self.icy_metadata = build_metadata_block(config.ICECAST_NAME)
+        self.shared_ring: Optional[SharedRingBuffer] = None
         self.playing = False
         self.stream = None
         self.throttle = None
         self.ffmpeg_process: Optional[subprocess.Popen] = None
+        self.frame_reader: Optional[Mp3FrameReader] = None
         self.is_downloading = False
+        self.refill_task: Optional[asyncio.Task] = None
         self.min_queue_size = DEFAULT_QUEUE_SIZE
-        self.previous_track: Optional[Dict] = None
-        self.start_time: Optional[float] = None
-        self.progress_interval = None
-        self.icecast_streamer: Optional[IcecastStreamer] = None
+        self.clock = PlaybackClock()
+        self.progress_event_interval = config.PLAYBACK_PROGRESS_INTERVAL
+        self.upcoming_event_lead = config.PLAYBACK_UPCOMING_LEAD
+        self.next_progress_at = self.progress_event_interval
+        self.track_duration: Optional[float] = None
+        self.track_announced = False
+        self.upcoming_announced = False
+        self.icecast_streamers: List[IcecastStreamer] = []
         self.use_icecast = False
         self.is_transitioning = False
         self.buffer_header = None
-        self.silence_generator = SilenceGenerator()
+        self.silence_generator = silence_generator
+        self.silence_task: Optional[asyncio.Task] = None
+        self.is_silent = False
+        self.mixer: Optional[CrossfadeMixer] = None
+        if config.CROSSFADE_DURATION > 0 or len(self.bitrate_ladder) > 1:
+            self.mixer = CrossfadeMixer(config.CROSSFADE_DURATION, self.bitrate_ladder, self.on_mixer_output, self.skip)
+    
+    @property
+    def clients(self) -> Dict[str, BytesIO]:
+        return {
+            client_id: client
+            for broadcaster in self.broadcasters.values()
+            for client_id, client in broadcaster.clients.items()
+        }
+    
+    @property
+    def current_track(self) -> Optional[TrackRecord]:
+        return self.track_list.current
+    
+    @property
+    def previous_track(self) -> Optional[TrackRecord]:
+        return self.track_list.get_previous()
     
     def initialize_icecast(self, config: dict) -> bool:
         if not config or not config.get('host') or not config.get('port') or not config.get('password'):
@@ -69,52 +116,51 @@ class Queue:
             return False
         
         try:
-            self.icecast_streamer = IcecastStreamer(config)
+            icecast_streamer = IcecastStreamer(config)
+            self.icecast_streamers.append(icecast_streamer)
             self.use_icecast = True
             
-            asyncio.create_task(self._connect_icecast())
+            asyncio.create_task(self._connect_icecast(icecast_streamer))
             
             return True
         except Exception as error:
             logger.error(f'Failed to initialize Icecast streamer: {error}')
-            self.use_icecast = False
+            self.use_icecast = len(self.icecast_streamers) > 0
             return False
     
-    async def _connect_icecast(self):
+    async def _connect_icecast(self, icecast_streamer: IcecastStreamer):
         try:
-            await self.icecast_streamer.connect()
-            logger.info('Successfully initialized Icecast streaming')
+            await icecast_streamer.connect()
+            logger.info(f"Successfully initialized Icecast streaming to {icecast_streamer.config['mount']}")
         except Exception as err:
             logger.error(f'Failed to connect to Icecast on initialization: {err}')
     
-    async def previous(self):
-        if not self.previous_track or self.is_transitioning:
+    async def previous(self, steps: int = 1):
+        previous_track = self.track_list.get_previous(steps)
+        if not previous_track or self.is_transitioning:
             logger.info("No previous track available")
             return
         
+        if not previous_track.url:
+            logger.info("Previous track URL is missing")
+            return
+        
+        if not os.path.exists(previous_track.url):
+            cached_path = cache_manager.get_from_cache(previous_track.title)
+            if not cached_path:
+                logger.info(f"Previous track {previous_track.title} not found in cache")
+                return
+            self.track_list.repin(previous_track, cached_path)
+        
         self.is_transitioning = True
         
         try:
             self.playing = False
-            logger.info(f"Going to previous track: {self.previous_track.get('title', 'Unknown')}")
+            logger.info(f"Going {steps} track(s) back to: {previous_track.title}")
             
             await self.cleanup_current_stream()
             
-            if self.previous_track.get('url'):
-                if self.previous_track['url'].startswith(f"{DEFAULT_TRACKS_LOCATION}/"):
-                    cached_path = cache_manager.get_from_cache(self.previous_track.get('title'))
-                    if cached_path:
-                        self.previous_track['url'] = cached_path
-                    else:
-                        logger.info(f"Previous track {self.previous_track.get('title', 'Unknown')} not found in cache")
-                        return
-            else:
-                logger.info("Previous track URL is missing")
-                return
-            
-            temp = self.current_track
-            self.current_track = self.previous_track
-            self.previous_track = temp
+            self.track_list.back(steps)
             
             self.playing = True
             await self.play(False)
@@ -125,6 +171,13 @@ class Queue:
         finally:
             self.is_transitioning = False
     
+    async def rewind(self, seconds: int):
+        if not self.current_track:
+            logger.warn("No current track to rewind")
+            return
+        
+        await self.seek(max(0, int(self.clock.position - seconds)))
+    
     async def ensure_queue_size(self):
         if self.is_downloading:
             return
@@ -132,21 +185,80 @@ class Queue:
         self.is_downloading = True
         
         try:
-            while len(self.tracks) < self.min_queue_size:
+            while len(self.track_list.upcoming) < self.min_queue_size:
                 song = await fetch_next_track()
-                if len(self.tracks) < self.min_queue_size:
-                    song_bitrate = await self.get_track_bitrate(song['url'])
-                    self.tracks.append({
-                        'url': song['url'],
-                        'bitrate': song_bitrate,
-                        'title': song['title'],
-                        'duration': duration_formatter(song.get('duration', 0)),
-                        'requestedBy': song.get('requestedBy', 'anonymous')
-                    })
+                if len(self.track_list.upcoming) < self.min_queue_size:
+                    track = TrackRecord(
+                        url=song['url'],
+                        bitrate=await self.get_track_bitrate(song['url']),
+                        title=song['title'],
+                        duration=duration_formatter(song.get('duration', 0)),
+                        requested_by=song.get('requestedBy', 'anonymous'),
+                        downloaded=song.get('downloaded', False)
+                    )
+                    await self.prepare_track(track)
+                    self.track_list.add(track)
                     logger.info(f"Added track: {song['title']}")
+            
+            for track in list(self.track_list.upcoming)[:self.min_queue_size]:
+                if not track.index and os.path.splitext(track.url)[1] == '.mp3':
+                    await self.prepare_track(track)
         finally:
             self.is_downloading = False
     
+    def schedule_refill(self):
+        if self.refill_task and not self.refill_task.done():
+            return
+        self.refill_task = asyncio.create_task(self.refill_queue())
+    
+    async def refill_queue(self):
+        try:
+            await self.ensure_queue_size()
+        except Exception as error:
+            logger.error(f"Error refilling queue: {error}")
+    
+    async def prepare_track(self, track: TrackRecord):
+        file_path = track.url
+        if not file_path or not os.path.exists(file_path):
+            return
+        
+        if os.path.splitext(file_path)[1] != '.mp3' and not self.mixer:
+            target_path = f"{os.path.splitext(file_path)[0]}.mp3"
+            
+            if not os.path.exists(target_path):
+                temp_path = f"{target_path}.part"
+                process = await asyncio.create_subprocess_exec(
+                    get_ffmpeg_path(),
+                    '-y',
+                    '-i', file_path,
+                    '-vn',
+                    '-f', 'mp3',
+                    '-ab', f"{track.bitrate // 1000}k",
+                    temp_path,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                
+                if await process.wait() != 0:
+                    logger.error(f"Error encoding stream copy of {file_path}")
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    return
+                
+                os.replace(temp_path, target_path)
+                logger.info(f"Encoded stream copy of {file_path}")
+            
+            if track.downloaded and os.path.dirname(os.path.abspath(file_path)) == os.path.abspath(DEFAULT_TRACKS_LOCATION):
+                try:
+                    os.remove(file_path)
+                except Exception as error:
+                    logger.warn(f"Could not remove source file {file_path}: {error}")
+            
+            track.url = file_path = target_path
+        
+        if os.path.splitext(file_path)[1] == '.mp3':
+            track.index = await asyncio.to_thread(FrameIndex.load_or_build, file_path)
+    
     async def get_track_bitrate(self, file_path: str) -> int:
         try:
             if not os.path.exists(file_path):
@@ -156,8 +268,6 @@ class Queue:
             process = await asyncio.create_subprocess_exec(
                 get_ffmpeg_path(),
                 '-i', file_path,
-                '-f', 'null',
-                '-',
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
@@ -190,55 +300,67 @@ class Queue:
                 logger.warn(f"Directory not found: {directory}")
                 return
             
-            files = [f for f in os.listdir(directory) if f.endswith('.mp3')]
+            files = [f for f in os.listdir(directory) if os.path.splitext(f)[1] in AUDIO_FILE_EXTENSIONS]
             
             for file in files:
                 file_path = os.path.join(directory, file)
                 bitrate = await self.get_track_bitrate(file_path)
                 
-                self.tracks.append({
-                    'url': file_path,
-                    'bitrate': bitrate,
-                    'title': file.replace('.mp3', ''),
-                    'duration': '00:00',
-                    'requestedBy': 'system'
-                })
+                self.track_list.add(TrackRecord(
+                    url=file_path,
+                    bitrate=bitrate,
+                    title=os.path.splitext(file)[0],
+                    duration='00:00',
+                    requested_by='system'
+                ))
             
             logger.info(f"Loaded {len(files)} tracks from {directory}")
         except Exception as error:
             logger.error(f"Error loading tracks: {error}")
     
     async def play(self, advance: bool = True):
-        await self.ensure_queue_size()
-        
-        if not self.tracks:
-            logger.warn("No tracks available")
-            await self.play_silence()
-            return
-        
-        if advance:
-            self.previous_track = self.current_track
-            self.index = (self.index + 1) % len(self.tracks)
+        should_advance = advance or not self.current_track
+        if should_advance and not self.track_list.upcoming:
+            self.schedule_refill()
+            await asyncio.shield(self.refill_task)
+        
+        finished_track = None
+        if should_advance:
+            finished_track = self.current_track
+            if not self.track_list.advance():
+                logger.warn("No tracks available")
+                await self.play_silence()
+                return
         
-        self.current_track = self.tracks[self.index]
         logger.info(f"Now playing: {self.current_track.get('title', 'Unknown')}")
         
-        await socket_manager.emit('trackChanged', {
-            'title': self.current_track.get('title', 'Unknown'),
-            'duration': self.current_track.get('duration', '00:00'),
-            'requestedBy': self.current_track.get('requestedBy', 'anonymous')
-        })
-        
         await self.cleanup_current_stream()
+        await self.retire_track(finished_track)
         
         self.stream = PassThrough()
         self.playing = True
-        self.start_time = asyncio.get_event_loop().time()
-        
-        self.start_progress_update()
+        self.is_silent = False
+        self.track_announced = False
+        self.track_duration = duration_to_seconds(self.current_track.get('duration', '00:00')) or None
+        self.reset_clock()
         
+        self.schedule_refill()
         await self.stream_audio()
     
+    async def retire_track(self, track: Optional[TrackRecord]):
+        if not track or not track.downloaded or not track.url or not os.path.exists(track.url):
+            return
+        if os.path.dirname(os.path.abspath(track.url)) != os.path.abspath(DEFAULT_TRACKS_LOCATION):
+            return
+        if cache_manager.get_pin_count(track.url) > 1:
+            return
+        
+        source_path = track.url
+        self.track_list.repin(track, cache_manager.get_cached_path(track.title, os.path.splitext(source_path)[1] or '.mp3'))
+        
+        if not await asyncio.to_thread(cache_manager.move_to_cache, source_path, track.title):
+            self.track_list.repin(track, source_path)
+    
     async def play_silence(self):
         logger.info("Playing silence...")
         
@@ -252,71 +374,32 @@ class Queue:
         
         self.stream = PassThrough()
         self.playing = True
+        self.is_silent = True
+        self.set_icy_metadata('Silence')
         
-        silence_stream = self.silence_generator.generate_silence()
-        
-        ffmpeg_args = [
-            get_ffmpeg_path(),
-            '-f', 's16le',
-            '-ar', '44100',
-            '-ac', '2',
-            '-i', 'pipe:0',
-            '-f', 'mp3',
-            '-ab', '128k',
-            '-'
-        ]
-        
-        self.ffmpeg_process = subprocess.Popen(
-            ffmpeg_args,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        if self.mixer:
+            await self.mixer.start()
+            await self.mixer.fade_out()
+            return
         
-        asyncio.create_task(self._stream_silence(silence_stream))
+        self.silence_task = asyncio.create_task(self._stream_silence())
     
-    async def _stream_silence(self, silence_stream):
+    async def _stream_silence(self):
         try:
             loop = asyncio.get_event_loop()
+            chunk, duration = self.silence_generator.get_silence(STREAM_CHUNK_DURATION)
+            started_at = loop.time()
+            sent = 0.0
             
-            async def write_silence():
-                for chunk in silence_stream:
-                    if not self.playing or not self.ffmpeg_process:
-                        break
-                    try:
-                        self.ffmpeg_process.stdin.write(chunk)
-                        await asyncio.sleep(0.01)
-                    except:
-                        break
-            
-            async def read_output():
-                while self.playing and self.ffmpeg_process:
-                    try:
-                        chunk = await loop.run_in_executor(
-                            None,
-                            self.ffmpeg_process.stdout.read,
-                            4096
-                        )
-                        if not chunk:
-                            break
-                        
-                        self.stream.write(chunk)
-                        
-                        if self.use_icecast and self.icecast_streamer:
-                            self.icecast_streamer.write(chunk)
-                        
-                        for client in self.clients.values():
-                            try:
-                                await client.write(chunk)
-                            except:
-                                pass
-                        
-                        await socket_manager.emit('stream', chunk)
-                    except:
-                        break
-            
-            await asyncio.gather(write_silence(), read_output())
+            while self.playing:
+                await self.broadcast(chunk)
+                sent += duration
+                
+                delay = started_at + sent - STREAM_READ_AHEAD - loop.time()
+                await asyncio.sleep(max(0, delay))
         
+        except asyncio.CancelledError:
+            pass
         except Exception as error:
             logger.error(f"Error streaming silence: {error}")
     
@@ -328,6 +411,27 @@ class Queue:
             await self.skip()
             return
         
+        index = self.current_track.index
+        if not index and os.path.splitext(file_path)[1] == '.mp3':
+            index = await asyncio.to_thread(FrameIndex.load_or_build, file_path)
+            self.current_track.index = index
+        if index:
+            self.track_duration = index.duration
+        
+        if self.mixer:
+            try:
+                await self.mixer.start()
+                await self.mixer.load(file_path, duration=self.track_duration)
+            except Exception as error:
+                logger.error(f"Error loading track into mixer: {error}")
+                await self.skip()
+            return
+        
+        if index:
+            self.frame_reader = Mp3FrameReader(file_path, index)
+            asyncio.create_task(self._stream_frames(self.frame_reader))
+            return
+        
         bitrate = self.current_track.get('bitrate', 128000)
         
         ffmpeg_args = [
@@ -353,6 +457,60 @@ class Queue:
             logger.error(f"Error starting FFmpeg: {error}")
             await self.skip()
     
+    async def _stream_frames(self, reader: Mp3FrameReader):
+        try:
+            loop = asyncio.get_event_loop()
+            seek_count = reader.seek_count
+            started_at = loop.time()
+            sent = 0.0
+            
+            while self.playing and self.frame_reader is reader:
+                if reader.seek_count != seek_count:
+                    seek_count = reader.seek_count
+                    started_at = loop.time()
+                    sent = 0.0
+                
+                chunk, duration = reader.read(STREAM_CHUNK_DURATION)
+                if not chunk:
+                    logger.info("Track finished playing")
+                    await self.skip()
+                    break
+                
+                await self.broadcast(chunk)
+                await self.advance_clock(duration)
+                sent += duration
+                
+                delay = started_at + sent - STREAM_READ_AHEAD - loop.time()
+                await asyncio.sleep(max(0, delay))
+        
+        except Exception as error:
+            logger.error(f"Error streaming frames: {error}")
+    
+    async def on_mixer_output(self, bitrate: int, chunk: bytes):
+        if bitrate != self.primary_bitrate:
+            self.broadcasters[bitrate].write(chunk)
+            return
+        
+        await self.broadcast(chunk)
+        await self.advance_clock(self.clock.measure(chunk))
+    
+    async def broadcast(self, chunk: bytes):
+        if self.stream:
+            self.stream.write(chunk)
+        
+        for icecast_streamer in self.icecast_streamers:
+            icecast_streamer.write(chunk)
+        
+        self.broadcasters[self.primary_bitrate].write(chunk)
+        
+        if self.hls_segmenter:
+            self.hls_segmenter.feed(chunk)
+        
+        if self.shared_ring:
+            self.shared_ring.write(chunk)
+        
+        await socket_manager.emit('stream', chunk)
+    
     async def _read_ffmpeg_output(self):
         try:
             loop = asyncio.get_event_loop()
@@ -370,18 +528,8 @@ class Queue:
                         await self.skip()
                         break
                     
-                    self.stream.write(chunk)
-                    
-                    if self.use_icecast and self.icecast_streamer:
-                        self.icecast_streamer.write(chunk)
-                    
-                    for client in self.clients.values():
-                        try:
-                            await client.write(chunk)
-                        except:
-                            pass
-                    
-                    await socket_manager.emit('stream', chunk)
+                    await self.broadcast(chunk)
+                    await self.advance_clock(self.clock.measure(chunk))
                 
                 except Exception as error:
                     if self.playing:
@@ -420,22 +568,33 @@ class Queue:
             logger.warn("No current track to seek")
             return
         
+        if self.frame_reader:
+            self.frame_reader.seek(seconds)
+            self.reset_clock(self.frame_reader.position)
+            return
+        
         file_path = self.current_track.get('url')
         
         if not os.path.exists(file_path):
             logger.error(f"Track file not found: {file_path}")
             return
         
+        if self.mixer:
+            await self.mixer.load(file_path, start=seconds, duration=self.track_duration, fade=SEEK_FADE_DURATION)
+            self.reset_clock(seconds)
+            return
+        
         await self.cleanup_current_stream()
         
         self.stream = PassThrough()
         self.playing = True
-        self.start_time = asyncio.get_event_loop().time() - seconds
+        self.reset_clock(seconds)
         
         bitrate = self.current_track.get('bitrate', 128000)
         
         ffmpeg_args = [
             get_ffmpeg_path(),
+            '-re',
             '-ss', str(seconds),
             '-i', file_path,
             '-f', 'mp3',
@@ -457,7 +616,9 @@ class Queue:
             logger.error(f"Error seeking: {error}")
     
     async def cleanup_current_stream(self):
-        self.stop_progress_update()
+        if self.silence_task:
+            self.silence_task.cancel()
+            self.silence_task = None
         
         if self.ffmpeg_process:
             try:
@@ -470,44 +631,114 @@ class Queue:
                     pass
             self.ffmpeg_process = None
         
+        if self.frame_reader:
+            self.frame_reader.close()
+            self.frame_reader = None
+        
         if self.stream:
             self.stream.close()
             self.stream = None
     
-    def start_progress_update(self):
-        self.stop_progress_update()
-        
-        async def update_progress():
-            while self.playing and self.current_track:
-                await asyncio.sleep(5)
-                
-                if self.start_time:
-                    elapsed = int(asyncio.get_event_loop().time() - self.start_time)
-                    await socket_manager.emit('progress', {
-                        'title': self.current_track.get('title', 'Unknown'),
-                        'elapsed': elapsed
-                    })
+    def enable_shared_ring(self, path: str) -> bool:
+        try:
+            self.shared_ring = SharedRingBuffer.create(path)
+            self.shared_ring.set_metadata(self.icy_metadata)
+            logger.info(f"Writing stream into shared ring buffer at {path}")
+            return True
+        except Exception as error:
+            logger.error(f"Failed to create shared ring buffer: {error}")
+            return False
+    
+    def set_icy_metadata(self, title: str):
+        self.icy_metadata = build_metadata_block(title)
+        if self.shared_ring:
+            self.shared_ring.set_metadata(self.icy_metadata)
+    
+    def reset_clock(self, position: float = 0.0):
+        self.clock.reset(position)
+        self.next_progress_at = (int(position // self.progress_event_interval) + 1) * self.progress_event_interval
+        self.upcoming_announced = False
+    
+    async def advance_clock(self, duration: float):
+        if not self.current_track or self.is_silent:
+            return
         
-        self.progress_interval = asyncio.create_task(update_progress())
+        if not self.track_announced:
+            self.track_announced = True
+            self.set_icy_metadata(self.current_track.get('title', 'Unknown'))
+            for icecast_streamer in self.icecast_streamers:
+                asyncio.create_task(icecast_streamer.update_metadata(self.current_track.get('title', 'Unknown')))
+            await socket_manager.emit('trackChanged', {
+                'title': self.current_track.get('title', 'Unknown'),
+                'duration': self.current_track.get('duration', '00:00'),
+                'requestedBy': self.current_track.get('requestedBy', 'anonymous')
+            })
+        
+        self.clock.advance(duration)
+        position = self.clock.position
+        
+        if position >= self.next_progress_at:
+            self.next_progress_at = (int(position // self.progress_event_interval) + 1) * self.progress_event_interval
+            await socket_manager.emit('progress', {
+                'title': self.current_track.get('title', 'Unknown'),
+                'elapsed': int(position)
+            })
+        
+        upcoming_track = self.track_list.get_upcoming()
+        if (
+            not self.upcoming_announced
+            and upcoming_track
+            and self.track_duration
+            and self.track_duration - position <= self.upcoming_event_lead
+        ):
+            self.upcoming_announced = True
+            await socket_manager.emit('upcoming', {
+                'title': upcoming_track.get('title', 'Unknown'),
+                'duration': upcoming_track.get('duration', '00:00'),
+                'requestedBy': upcoming_track.get('requestedBy', 'anonymous')
+            })
+    
+    def get_broadcaster(self, bitrate: Optional[int] = None) -> Broadcaster:
+        if not bitrate or not self.mixer:
+            return self.broadcasters[self.primary_bitrate]
+        return self.broadcasters[min(self.bitrate_ladder, key=lambda rung: abs(rung - bitrate))]
     
-    def stop_progress_update(self):
-        if self.progress_interval:
-            self.progress_interval.cancel()
-            self.progress_interval = None
+    def can_admit(self, ip: Optional[str] = None) -> Optional[str]:
+        if self.max_listeners and len(self.client_ips) >= self.max_listeners:
+            return 'Listener limit reached'
+        if ip and self.max_listeners_per_ip and self.listeners_by_ip.get(ip, 0) >= self.max_listeners_per_ip:
+            return 'Too many listeners from this address'
+        return None
     
-    def add_client(self):
-        client_id = str(uuid.uuid4())
-        stream_buffer = BytesIO()
+    def add_client(self, bitrate: Optional[int] = None, ip: Optional[str] = None):
+        broadcaster = self.get_broadcaster(bitrate)
+        client_info = broadcaster.add_client()
+        
+        self.client_ips[client_info['id']] = ip
+        if ip:
+            self.listeners_by_ip[ip] = self.listeners_by_ip.get(ip, 0) + 1
         
-        self.clients[client_id] = stream_buffer
-        logger.info(f"Client connected: {client_id}, Total: {len(self.clients)}")
+        logger.info(f"Client connected: {client_info['id']} ({broadcaster.bitrate}kbps), Total: {len(self.client_ips)}")
         
-        return {'id': client_id, 'client': stream_buffer}
+        return client_info
+    
+    def has_client(self, client_id: str) -> bool:
+        return any(client_id in broadcaster.clients for broadcaster in self.broadcasters.values())
     
     def remove_client(self, client_id: str):
-        if client_id in self.clients:
-            del self.clients[client_id]
-            logger.info(f"Client disconnected: {client_id}, Remaining: {len(self.clients)}")
+        for broadcaster in self.broadcasters.values():
+            broadcaster.remove_client(client_id)
+        
+        if client_id not in self.client_ips:
+            return
+        
+        ip = self.client_ips.pop(client_id)
+        if ip:
+            self.listeners_by_ip[ip] -= 1
+            if self.listeners_by_ip[ip] <= 0:
+                del self.listeners_by_ip[ip]
+        
+        logger.info(f"Client disconnected: {client_id}, Remaining: {len(self.client_ips)}")
     
     def get_icecast_status(self):
         if not self.use_icecast:
@@ -517,14 +748,17 @@ class Queue:
                 'message': 'Icecast not configured'
             }
         
+        primary = self.icecast_streamers[0]
+        
         return {
             'enabled': True,
-            'connected': self.icecast_streamer.is_connected if self.icecast_streamer else False,
+            'connected': any(icecast_streamer.is_connected for icecast_streamer in self.icecast_streamers),
             'config': {
-                'host': self.icecast_streamer.config.get('host') if self.icecast_streamer else None,
-                'port': self.icecast_streamer.config.get('port') if self.icecast_streamer else None,
-                'mount': self.icecast_streamer.config.get('mount') if self.icecast_streamer else None
-            }
+                'host': primary.config.get('host'),
+                'port': primary.config.get('port'),
+                'mount': primary.config.get('mount')
+            },
+            'outputs': [icecast_streamer.get_status() for icecast_streamer in self.icecast_streamers]
         }
 
 
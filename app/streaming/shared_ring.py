@@ -0,0 +1,102 @@
+import mmap
+import os
+import struct
+from typing import Optional
+from app.core.constants import STREAM_RING_SIZE
+from app.streaming.mp3_frames import find_frame
+
+RING_MAGIC = b'MRRB'
+RING_HEADER = struct.Struct('<4sIQII')
+METADATA_OFFSET = 64
+METADATA_SIZE = 4096
+DATA_OFFSET = METADATA_OFFSET + METADATA_SIZE
+
+class SharedRingBuffer:
+    def __init__(self, path: str, memory: mmap.mmap, capacity: int):
+        self.path = path
+        self.memory = memory
+        self.capacity = capacity
+        self.metadata_version = -1
+        self.metadata = b''
+    
+    @staticmethod
+    def create(path: str, capacity: int = STREAM_RING_SIZE):
+        with open(path, 'w+b') as file:
+            file.truncate(DATA_OFFSET + capacity)
+            memory = mmap.mmap(file.fileno(), DATA_OFFSET + capacity)
+        RING_HEADER.pack_into(memory, 0, RING_MAGIC, capacity, 0, 0, 0)
+        return SharedRingBuffer(path, memory, capacity)
+    
+    @staticmethod
+    def open(path: str):
+        with open(path, 'r+b') as file:
+            size = os.fstat(file.fileno()).st_size
+            memory = mmap.mmap(file.fileno(), size)
+        magic, capacity, _, _, _ = RING_HEADER.unpack_from(memory, 0)
+        if magic != RING_MAGIC or size != DATA_OFFSET + capacity:
+            memory.close()
+            raise ValueError(f"Not a stream ring buffer: {path}")
+        return SharedRingBuffer(path, memory, capacity)
+    
+    @property
+    def write_position(self) -> int:
+        return struct.unpack_from('<Q', self.memory, 8)[0]
+    
+    def write(self, chunk: bytes):
+        position = self.write_position
+        if len(chunk) > self.capacity:
+            position += len(chunk) - self.capacity
+            chunk = chunk[-self.capacity:]
+        
+        offset = position % self.capacity
+        first = min(len(chunk), self.capacity - offset)
+        self.memory[DATA_OFFSET + offset:DATA_OFFSET + offset + first] = chunk[:first]
+        if first < len(chunk):
+            self.memory[DATA_OFFSET:DATA_OFFSET + len(chunk) - first] = chunk[first:]
+        
+        struct.pack_into('<Q', self.memory, 8, position + len(chunk))
+    
+    def read(self, position: int, limit: Optional[int] = None):
+        end = self.write_position
+        if limit:
+            end = min(end, position + limit)
+        if end <= position:
+            return b'', position
+        if end - position > self.capacity:
+            return None, position
+        
+        offset = position % self.capacity
+        size = end - position
+        first = min(size, self.capacity - offset)
+        data = self.memory[DATA_OFFSET + offset:DATA_OFFSET + offset + first]
+        if first < size:
+            data += self.memory[DATA_OFFSET:DATA_OFFSET + size - first]
+        
+        if self.write_position - position > self.capacity:
+            return None, position
+        return data, end
+    
+    def live_position(self, backlog: int = 0) -> int:
+        end = self.write_position
+        start = max(0, end - min(backlog, self.capacity // 2))
+        data, _ = self.read(start)
+        if not data:
+            return end
+        frame = find_frame(data, 0)
+        return start + frame if frame >= 0 else end
+    
+    def set_metadata(self, block: bytes):
+        block = block[:METADATA_SIZE]
+        _, _, _, version, _ = RING_HEADER.unpack_from(self.memory, 0)
+        self.memory[METADATA_OFFSET:METADATA_OFFSET + len(block)] = block
+        struct.pack_into('<II', self.memory, 16, version + 1, len(block))
+    
+    def get_metadata(self) -> bytes:
+        version, length = struct.unpack_from('<II', self.memory, 16)
+        if version != self.metadata_version:
+            self.metadata = self.memory[METADATA_OFFSET:METADATA_OFFSET + length]
+            self.metadata_version = version
+        return self.metadata
+    
+    def close(self):
+        self.memory.close()
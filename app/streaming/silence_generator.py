@@ -1,34 +1,25 @@
-from app.core import logger
-
 class SilenceGenerator:
     def __init__(self):
         self.bitrate = 128
         self.sample_rate = 44100
+        self.frame_duration = 1152 / self.sample_rate
+        self.silence_frame = self.build_silence_frame()
+        self.buffers = {}
     
-    def generate_silence(self):
-        """Generate infinite silence stream as an iterator"""
-        try:
-            frame_header = bytes([0xFF, 0xFB, 0x90, 0x00])
-            frame_size = int((144 * self.bitrate * 1000) / self.sample_rate)
-            
-            silence_frame = bytearray(frame_size)
-            silence_frame[0:4] = frame_header
-            silence_bytes = bytes(silence_frame)
-            
-            logger.info(f"Starting silence generation (frame size: {frame_size} bytes)")
-            
-            while True:
-                yield silence_bytes
-        except Exception as error:
-            logger.error(f'Error generating silence: {str(error)}')
-            yield bytes([0xFF, 0xFB, 0x90, 0x00])
+    def build_silence_frame(self) -> bytes:
+        frame_header = bytes([0xFF, 0xFB, 0x90, 0x00])
+        frame_size = int((144 * self.bitrate * 1000) / self.sample_rate)
+        
+        silence_frame = bytearray(frame_size)
+        silence_frame[0:4] = frame_header
+        return bytes(silence_frame)
     
-    @staticmethod
-    def apply_fade(audio_buffer: bytes, fade_type: str = 'in', duration_ms: int = 50) -> bytes:
-        try:
-            return audio_buffer
-        except Exception as error:
-            logger.error(f'Error applying fade: {str(error)}')
-            return audio_buffer
+    def get_silence(self, duration: float):
+        frame_count = max(1, int(duration / self.frame_duration))
+        
+        if frame_count not in self.buffers:
+            self.buffers[frame_count] = self.silence_frame * frame_count
+        
+        return self.buffers[frame_count], frame_count * self.frame_duration
 
 silence_generator = SilenceGenerator()
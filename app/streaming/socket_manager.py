@@ -2,6 +2,8 @@ import socketio
 import asyncio
 from typing import Optional
 from app.core import logger
+from app.core.constants import DEFAULT_STATION_ID
+from app.core.station_context import get_station_id
 
 sio_server: Optional[socketio.AsyncServer] = None
 
@@ -44,6 +46,7 @@ class SocketManager:
                 'isAlive': True
             }
             
+            await sio_server.enter_room(sid, self.get_station_room(DEFAULT_STATION_ID))
             asyncio.create_task(self._heartbeat_checker(sid))
             
             if self.queue and self.queue.buffer_header:
@@ -55,6 +58,13 @@ class SocketManager:
             if sid in self.connected_clients:
                 del self.connected_clients[sid]
         
+        @sio_server.event
+        async def joinStation(sid, station_id):
+            for room in sio_server.rooms(sid):
+                if room.startswith('station:'):
+                    await sio_server.leave_room(sid, room)
+            await sio_server.enter_room(sid, self.get_station_room(station_id))
+        
         @sio_server.event
         async def pong(sid):
             if sid in self.connected_clients:
@@ -101,6 +111,9 @@ class SocketManager:
             raise Exception('Socket.io not initialized. Call initialize() first.')
         return sio_server
     
+    def get_station_room(self, station_id: str) -> str:
+        return f"station:{station_id}"
+    
     def get_connected_clients(self):
         return list(self.connected_clients.keys())
     
@@ -111,7 +124,7 @@ class SocketManager:
         global sio_server
         if sio_server is None:
             raise Exception('Socket.io not initialized. Call initialize() first.')
-        await sio_server.emit(event, data)
+        await sio_server.emit(event, data, room=self.get_station_room(get_station_id()))
     
     async def emit_to_client(self, socket_id, event, data):
         global sio_server
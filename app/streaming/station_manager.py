@@ -0,0 +1,57 @@
+import asyncio
+import re
+from typing import Dict, Optional
+from app.core import logger
+from app.core.config import config
+from app.core.constants import DEFAULT_STATION_ID, DEFAULT_TRACKS_LOCATION
+from app.core.station_context import current_station, get_station_id, station_path
+from app.streaming.queue import Queue, queue
+from app.services.initializer import Initializer
+from app.services.metadata_refresh_scheduler import metadata_refresh_scheduler
+
+STATION_ID_PATTERN = re.compile(r'^[a-z0-9][a-z0-9_-]*$')
+
+class Station:
+    def __init__(self, station_id: str, station_queue: Queue):
+        self.id = station_id
+        self.queue = station_queue
+        self.task = None
+
+class StationManager:
+    def __init__(self):
+        self.stations: Dict[str, Station] = {DEFAULT_STATION_ID: Station(DEFAULT_STATION_ID, queue)}
+        
+        for station_id in config.STATIONS:
+            if not STATION_ID_PATTERN.match(station_id):
+                logger.error(f"Invalid station id ignored: {station_id}")
+                continue
+            if station_id not in self.stations:
+                self.stations[station_id] = Station(station_id, Queue())
+    
+    def get(self, station_id: str) -> Optional[Station]:
+        return self.stations.get(station_id)
+    
+    def get_current(self) -> Station:
+        return self.stations[get_station_id()]
+    
+    def get_ids(self):
+        return list(self.stations.keys())
+    
+    def start(self):
+        for station in self.stations.values():
+            if station.id != DEFAULT_STATION_ID and not station.task:
+                station.task = asyncio.create_task(self.run_station(station))
+    
+    async def run_station(self, station: Station):
+        current_station.set(station.id)
+        
+        try:
+            await Initializer.init()
+            metadata_refresh_scheduler.start()
+            await station.queue.load_tracks(station_path(DEFAULT_TRACKS_LOCATION))
+            logger.info(f"Starting station: {station.id}")
+            await station.queue.play()
+        except Exception as error:
+            logger.error(f"Failed to start station {station.id}: {error}")
+
+station_manager = StationManager()
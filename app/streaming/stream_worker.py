@@ -0,0 +1,176 @@
+import asyncio
+import os
+import aiohttp
+from typing import Dict
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse, Response
+from fastapi.middleware.cors import CORSMiddleware
+from app.core import logger
+from app.core.config import config
+from app.core.constants import ICY_METAINT, LISTENER_RETRY_AFTER, STREAM_BURST_DURATION
+from app.core.utils import get_client_ip
+from app.streaming.icy import IcyMetadataInjector
+from app.streaming.shared_ring import SharedRingBuffer
+
+STREAM_READ_SIZE = 64 * 1024
+HOP_BY_HOP_HEADERS = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailer', 'transfer-encoding', 'upgrade'
+}
+
+app = FastAPI(title="MRadio stream worker")
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+class WorkerState:
+    def __init__(self):
+        self.ring = None
+        self.session = None
+        self.listeners = 0
+        self.listeners_by_ip: Dict[str, int] = {}
+        self.max_listeners = config.MAX_LISTENERS // max(1, config.STREAM_WORKERS)
+        self.burst_bytes = config.STREAM_BITRATE * 1000 // 8 * STREAM_BURST_DURATION
+        self.producer_url = f"http://127.0.0.1:{os.getenv('STREAM_PRODUCER_PORT', '5000')}"
+
+state = WorkerState()
+
+
+@app.on_event("startup")
+async def startup_event():
+    while not state.ring:
+        try:
+            state.ring = SharedRingBuffer.open(config.STREAM_RING_PATH)
+        except (OSError, ValueError):
+            logger.info(f"Waiting for stream ring buffer at {config.STREAM_RING_PATH}")
+            await asyncio.sleep(1)
+    
+    state.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+    logger.info(f"Stream worker {os.getpid()} attached to {config.STREAM_RING_PATH}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if state.session:
+        await state.session.close()
+    if state.ring:
+        state.ring.close()
+
+
+def can_admit(ip):
+    if state.max_listeners and state.listeners >= state.max_listeners:
+        return 'Listener limit reached'
+    if ip and config.MAX_LISTENERS_PER_IP and state.listeners_by_ip.get(ip, 0) >= config.MAX_LISTENERS_PER_IP:
+        return 'Too many listeners from this address'
+    return None
+
+
+def release_listener(ip):
+    state.listeners -= 1
+    if ip:
+        state.listeners_by_ip[ip] -= 1
+        if state.listeners_by_ip[ip] <= 0:
+            del state.listeners_by_ip[ip]
+    logger.info(f"Client disconnected from worker {os.getpid()}, Remaining: {state.listeners}")
+
+
+async def ring_generator():
+    ring = state.ring
+    position = ring.live_position(state.burst_bytes)
+    
+    while True:
+        data, next_position = ring.read(position, STREAM_READ_SIZE)
+        
+        if data is None or (config.LISTENER_MAX_LAG_BYTES and ring.write_position - position > config.LISTENER_MAX_LAG_BYTES):
+            if config.LISTENER_LAG_POLICY == 'disconnect':
+                logger.warn(f"Disconnected lagging client on worker {os.getpid()}")
+                return
+            position = ring.live_position(state.burst_bytes)
+            continue
+        
+        position = next_position
+        if data:
+            yield data
+        else:
+            await asyncio.sleep(0.1)
+
+
+@app.get("/stream")
+async def stream(request: Request):
+    client_ip = get_client_ip(request)
+    rejection = can_admit(client_ip)
+    if rejection:
+        logger.warn(f"Rejected listener from {client_ip}: {rejection}")
+        return Response(
+            content=rejection,
+            status_code=503,
+            headers={"Retry-After": str(LISTENER_RETRY_AFTER)}
+        )
+    
+    state.listeners += 1
+    if client_ip:
+        state.listeners_by_ip[client_ip] = state.listeners_by_ip.get(client_ip, 0) + 1
+    logger.info(f"Client connected to worker {os.getpid()}, Total: {state.listeners}")
+    
+    headers = {
+        "Cache-Control": "no-cache, no-store, must-revalidate",
+        "Pragma": "no-cache",
+        "Expires": "0",
+        "Transfer-Encoding": "chunked"
+    }
+    
+    icy_injector = None
+    if request.headers.get("icy-metadata") == "1":
+        icy_injector = IcyMetadataInjector(state.ring.get_metadata, ICY_METAINT)
+        headers["icy-metaint"] = str(ICY_METAINT)
+        headers["icy-name"] = config.ICECAST_NAME
+    
+    async def stream_with_cleanup():
+        try:
+            async for chunk in ring_generator():
+                yield icy_injector.inject(chunk) if icy_injector else chunk
+        finally:
+            release_listener(client_ip)
+    
+    return StreamingResponse(
+        stream_with_cleanup(),
+        media_type="audio/mp3",
+        headers=headers
+    )
+
+
+def filter_headers(headers, excluded_headers=('host', 'content-length')) -> dict:
+    excluded = HOP_BY_HOP_HEADERS | set(excluded_headers)
+    connection_tokens = {token.strip().lower() for token in headers.get('connection', '').split(',') if token.strip()}
+    return {
+        key: value
+        for key, value in headers.items()
+        if key.lower() not in excluded and key.lower() not in connection_tokens
+    }
+
+
+@app.api_route("/api/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+async def forward_to_producer(path: str, request: Request):
+    headers = filter_headers(request.headers)
+    
+    try:
+        async with state.session.request(
+            request.method,
+            f"{state.producer_url}/api/{path}",
+            params=list(request.query_params.multi_items()),
+            headers=headers,
+            data=await request.body()
+        ) as response:
+            return Response(
+                content=await response.read(),
+                status_code=response.status,
+                headers=filter_headers(response.headers, ('content-length', 'content-encoding'))
+            )
+    except aiohttp.ClientError as error:
+        logger.error(f"Failed to reach stream producer: {error}")
+        return Response(content="Stream producer unavailable", status_code=502)
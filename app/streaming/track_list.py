@@ -0,0 +1,99 @@
+from collections import deque
+from app.core.constants import TRACK_HISTORY_SIZE
+from app.streaming.cache_manager import cache_manager
+
+class TrackRecord:
+    __slots__ = ('url', 'bitrate', 'title', 'duration', 'requested_by', 'downloaded', 'index')
+    
+    def __init__(self, url: str, bitrate: int = 128000, title: str = 'Unknown', duration: str = '00:00', requested_by: str = 'anonymous', downloaded: bool = False):
+        self.url = url
+        self.bitrate = bitrate
+        self.title = title
+        self.duration = duration
+        self.requested_by = requested_by
+        self.downloaded = downloaded
+        self.index = None
+    
+    def get(self, key: str, default=None):
+        if key == 'requestedBy':
+            key = 'requested_by'
+        if key not in self.__slots__:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+    
+    def __getitem__(self, key: str):
+        if key == 'requestedBy':
+            key = 'requested_by'
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        if key == 'requestedBy':
+            key = 'requested_by'
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def to_dict(self) -> dict:
+        return {
+            'url': self.url,
+            'bitrate': self.bitrate,
+            'title': self.title,
+            'duration': self.duration,
+            'requestedBy': self.requested_by
+        }
+
+class TrackList:
+    def __init__(self, history_size: int = TRACK_HISTORY_SIZE):
+        self.history_size = history_size
+        self.history = deque()
+        self.current = None
+        self.upcoming = deque()
+    
+    def __len__(self):
+        return len(self.upcoming) + (1 if self.current else 0)
+    
+    def add(self, track: TrackRecord):
+        cache_manager.pin(track.url)
+        self.upcoming.append(track)
+    
+    def push_history(self, track: TrackRecord):
+        self.history.append(track)
+        while len(self.history) > self.history_size:
+            evicted = self.history.popleft()
+            cache_manager.unpin(evicted.url)
+    
+    def advance(self):
+        if not self.upcoming:
+            return None
+        if self.current:
+            self.push_history(self.current)
+        self.current = self.upcoming.popleft()
+        return self.current
+    
+    def back(self, steps: int = 1):
+        if steps < 1 or len(self.history) < steps:
+            return None
+        for _ in range(steps):
+            if self.current:
+                self.upcoming.appendleft(self.current)
+            self.current = self.history.pop()
+        return self.current
+    
+    def get_previous(self, steps: int = 1):
+        if steps < 1 or len(self.history) < steps:
+            return None
+        return self.history[-steps]
+    
+    def repin(self, track: TrackRecord, url: str):
+        cache_manager.unpin(track.url)
+        track.url = url
+        cache_manager.pin(url)
+    
+    def get_upcoming(self):
+        return self.upcoming[0] if self.upcoming else None
+    
+    def get_all(self) -> list:
+        return ([self.current] if self.current else []) + list(self.upcoming)
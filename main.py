@@ -1,17 +1,27 @@
 import asyncio
-from fastapi import FastAPI
-from fastapi.responses import StreamingResponse, RedirectResponse
+import json
+import os
+import subprocess
+import sys
+from typing import Optional
+from fastapi import FastAPI, Request, Depends, HTTPException
+from fastapi.responses import StreamingResponse, RedirectResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import socketio
 import uvicorn
 from app.core import logger
 from app.core.config import config
-from app.core.constants import DEFAULT_TRACKS_LOCATION
+from app.core.constants import DEFAULT_TRACKS_LOCATION, DEFAULT_STATION_ID, ICY_METAINT, LISTENER_RETRY_AFTER
+from app.core.utils import get_client_ip
+from app.core.http_client import http_client
 from app.streaming.queue import queue
+from app.streaming.station_manager import station_manager
+from app.streaming.icy import IcyMetadataInjector
 from app.streaming.socket_manager import socket_manager
-from app.api.routes import router
+from app.api.routes import router, use_station
 from app.services.initializer import Initializer
 from app.services.api_service import Service
+from app.services.metadata_refresh_scheduler import metadata_refresh_scheduler
 
 PORT = 5000
 
@@ -36,13 +46,10 @@ socket_app = socketio.ASGIApp(
 api_service = Service()
 api_service.set_queue(queue)
 
+stream_workers: Optional[subprocess.Popen] = None
 
-@app.on_event("startup")
-async def startup_event():
-    logger.info("Starting MRadio server...")
-    
-    await Initializer.init()
-    
+
+def build_icecast_outputs():
     icecast_config = {
         'host': config.ICECAST_HOST,
         'port': config.ICECAST_PORT,
@@ -54,24 +61,92 @@ async def startup_event():
         'bitrate': config.ICECAST_BITRATE
     }
     
+    outputs = []
     if icecast_config['host'] and icecast_config['port'] and icecast_config['password']:
-        icecast_initialized = queue.initialize_icecast(icecast_config)
+        outputs.append(icecast_config)
+    
+    if config.ICECAST_OUTPUTS:
+        try:
+            for output in json.loads(config.ICECAST_OUTPUTS):
+                outputs.append({**icecast_config, **output})
+        except (ValueError, TypeError) as error:
+            logger.error(f"Invalid ICECAST_OUTPUTS configuration: {error}")
+    
+    return outputs
+
+
+def start_stream_workers():
+    if not queue.enable_shared_ring(config.STREAM_RING_PATH):
+        logger.warn('Stream workers disabled, serving /stream from the main process')
+        return None
+    
+    logger.info(f"Starting {config.STREAM_WORKERS} stream workers on port {config.STREAM_WORKER_PORT}")
+    return subprocess.Popen(
+        [
+            sys.executable, '-m', 'uvicorn', 'app.streaming.stream_worker:app',
+            '--host', '0.0.0.0',
+            '--port', str(config.STREAM_WORKER_PORT),
+            '--workers', str(config.STREAM_WORKERS),
+            '--no-access-log'
+        ],
+        env={**os.environ, 'STREAM_PRODUCER_PORT': str(PORT)}
+    )
+
+
+@app.on_event("startup")
+async def startup_event():
+    global stream_workers
+    
+    logger.info("Starting MRadio server...")
+    
+    await Initializer.init()
+    
+    metadata_refresh_scheduler.start()
+    
+    icecast_outputs = build_icecast_outputs()
+    
+    for icecast_config in icecast_outputs:
+        station = station_manager.get(icecast_config.get('station', DEFAULT_STATION_ID))
+        if not station:
+            logger.error(f"Icecast output {icecast_config['mount']} references unknown station: {icecast_config['station']}")
+            continue
+        
+        icecast_initialized = station.queue.initialize_icecast(icecast_config)
         if icecast_initialized:
             logger.info('Icecast streaming enabled')
             logger.info(f"Stream will be available at: http://{icecast_config['host']}:{icecast_config['port']}{icecast_config['mount']}")
         else:
             logger.warn('Failed to initialize Icecast streaming, falling back to direct HTTP streaming')
-    else:
+    
+    if not icecast_outputs:
         logger.info('Icecast configuration not found in .env, using direct HTTP streaming only')
     
+    if config.STREAM_WORKERS > 0:
+        stream_workers = start_stream_workers()
+    
     await queue.load_tracks(DEFAULT_TRACKS_LOCATION)
     
     asyncio.create_task(queue.play())
     
+    station_manager.start()
+    
     logger.info(f"MRadio server started on port {PORT}")
-    if queue.use_icecast:
-        logger.info(f"Icecast stream available at: http://{icecast_config['host']}:{icecast_config['port']}{icecast_config['mount']}")
+    for icecast_streamer in queue.icecast_streamers:
+        logger.info(f"Icecast stream available at: http://{icecast_streamer.config['host']}:{icecast_streamer.config['port']}{icecast_streamer.config['mount']}")
     logger.info(f"Direct HTTP stream available at: http://localhost:{PORT}/stream")
+    for station_id in station_manager.get_ids():
+        if station_id != DEFAULT_STATION_ID:
+            logger.info(f"Station {station_id} stream available at: http://localhost:{PORT}/stations/{station_id}/stream")
+    if stream_workers:
+        logger.info(f"Worker HTTP stream available at: http://localhost:{config.STREAM_WORKER_PORT}/stream")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if stream_workers and stream_workers.poll() is None:
+        stream_workers.terminate()
+    
+    await http_client.close()
 
 
 @app.get("/")
@@ -79,42 +154,119 @@ async def root():
     return RedirectResponse(url="/stream")
 
 
-async def stream_generator(client_buffer):
+def get_station_queue(station_id: str):
+    station = station_manager.get(station_id)
+    if not station:
+        raise HTTPException(status_code=404, detail=f"Station not found: {station_id}")
+    return station.queue
+
+
+async def stream_generator(station_queue, client_id, client_buffer):
     try:
-        while True:
-            await asyncio.sleep(0.1)
-            
+        while station_queue.has_client(client_id):
             data = client_buffer.getvalue()
             if data:
-                yield data
                 client_buffer.seek(0)
                 client_buffer.truncate()
+                yield data
+            
+            await asyncio.sleep(0.1)
     except Exception as e:
         logger.error(f"Stream generator error: {e}")
 
 
 @app.get("/stream")
-async def stream():
-    client_info = queue.add_client()
+async def stream(request: Request, bitrate: Optional[int] = None):
+    return serve_stream(queue, request, bitrate)
+
+
+@app.get("/stations/{station_id}/stream")
+async def station_stream(request: Request, station_id: str, bitrate: Optional[int] = None):
+    return serve_stream(get_station_queue(station_id), request, bitrate)
+
+
+def serve_stream(station_queue, request: Request, bitrate: Optional[int] = None):
+    client_ip = get_client_ip(request)
+    rejection = station_queue.can_admit(client_ip)
+    if rejection:
+        logger.warn(f"Rejected listener from {client_ip}: {rejection}")
+        return Response(
+            content=rejection,
+            status_code=503,
+            headers={"Retry-After": str(LISTENER_RETRY_AFTER)}
+        )
+    
+    client_info = station_queue.add_client(bitrate, client_ip)
     client_id = client_info['id']
     client_buffer = client_info['client']
     
+    headers = {
+        "Cache-Control": "no-cache, no-store, must-revalidate",
+        "Pragma": "no-cache",
+        "Expires": "0",
+        "Transfer-Encoding": "chunked"
+    }
+    
+    icy_injector = None
+    if request.headers.get("icy-metadata") == "1":
+        icy_injector = IcyMetadataInjector(lambda: station_queue.icy_metadata, ICY_METAINT)
+        headers["icy-metaint"] = str(ICY_METAINT)
+        headers["icy-name"] = config.ICECAST_NAME
+    
     async def stream_with_cleanup():
         try:
-            async for chunk in stream_generator(client_buffer):
-                yield chunk
+            async for chunk in stream_generator(station_queue, client_id, client_buffer):
+                yield icy_injector.inject(chunk) if icy_injector else chunk
         finally:
-            queue.remove_client(client_id)
+            station_queue.remove_client(client_id)
     
     return StreamingResponse(
         stream_with_cleanup(),
         media_type="audio/mp3",
-        headers={
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
-            "Transfer-Encoding": "chunked"
-        }
+        headers=headers
+    )
+
+
+@app.get("/hls/live.m3u8")
+async def hls_playlist():
+    return serve_hls_playlist(queue)
+
+
+@app.get("/stations/{station_id}/hls/live.m3u8")
+async def station_hls_playlist(station_id: str):
+    return serve_hls_playlist(get_station_queue(station_id))
+
+
+def serve_hls_playlist(station_queue):
+    if not station_queue.hls_segmenter:
+        return Response(status_code=404)
+    
+    return Response(
+        content=station_queue.hls_segmenter.get_playlist(),
+        media_type="application/vnd.apple.mpegurl",
+        headers={"Cache-Control": "max-age=1"}
+    )
+
+
+@app.get("/hls/segment_{sequence}.mp3")
+async def hls_segment(sequence: int):
+    return serve_hls_segment(queue, sequence)
+
+
+@app.get("/stations/{station_id}/hls/segment_{sequence}.mp3")
+async def station_hls_segment(station_id: str, sequence: int):
+    return serve_hls_segment(get_station_queue(station_id), sequence)
+
+
+def serve_hls_segment(station_queue, sequence: int):
+    segment = station_queue.hls_segmenter.get_segment(sequence) if station_queue.hls_segmenter else None
+    if segment is None:
+        return Response(status_code=404)
+    
+    return Response(
+        content=segment,
+        media_type="audio/mpeg",
+        headers={"Cache-Control": "public, max-age=3600"}
     )
 
 
@@ -124,7 +276,18 @@ async def icecast_status():
     return status
 
 
+@app.get("/api/stations/{station_id}/icecast/status")
+async def station_icecast_status(station_id: str):
+    return get_station_queue(station_id).get_icecast_status()
+
+
+@app.get("/api/stations")
+async def list_stations():
+    return {"stations": station_manager.get_ids()}
+
+
 app.include_router(router, prefix="/api")
+app.include_router(router, prefix="/api/stations/{station_id}", dependencies=[Depends(use_station)])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+from app.core.config import config
+from app.core.utils import get_client_ip
+
+
+def create_request(headers: dict, host: str = '10.0.0.2'):
+    return SimpleNamespace(headers=headers, client=SimpleNamespace(host=host))
+
+
+def test_proxy_headers_are_ignored_by_default(monkeypatch):
+    monkeypatch.setattr(config, 'TRUST_PROXY_HEADERS', False)
+    
+    assert get_client_ip(create_request({'x-forwarded-for': '203.0.113.7'})) == '10.0.0.2'
+
+
+def test_trusted_proxy_headers_resolve_the_listener(monkeypatch):
+    monkeypatch.setattr(config, 'TRUST_PROXY_HEADERS', True)
+    
+    assert get_client_ip(create_request({'x-forwarded-for': '203.0.113.7, 10.0.0.1'})) == '203.0.113.7'
+    assert get_client_ip(create_request({'forwarded': 'for=192.0.2.60:4711;proto=http, for=10.0.0.1'})) == '192.0.2.60'
+    assert get_client_ip(create_request({'forwarded': 'for="[2001:db8::1]:4711"'})) == '2001:db8::1'
+    assert get_client_ip(create_request({})) == '10.0.0.2'
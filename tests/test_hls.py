@@ -0,0 +1,47 @@
+import struct
+from app.streaming.hls import HlsSegmenter, TIMESTAMP_OWNER, build_timestamp_tag
+from app.streaming.mp3_frames import get_id3v2_size
+
+FRAME = b'\xff\xfb\x90\x00' + b'\x00' * 413
+FRAME_DURATION = 1152 / 44100
+
+
+def read_timestamp(segment: bytes) -> int:
+    tag_size = get_id3v2_size(segment)
+    owner_end = segment.index(TIMESTAMP_OWNER) + len(TIMESTAMP_OWNER)
+    assert owner_end + 8 == tag_size
+    return struct.unpack('>Q', segment[owner_end:tag_size])[0]
+
+
+def test_timestamp_tag_is_a_valid_id3_priv_frame():
+    tag = build_timestamp_tag(10)
+    
+    assert tag.startswith(b'ID3\x04')
+    assert get_id3v2_size(tag) == len(tag)
+    assert read_timestamp(tag) == 900000
+
+
+def test_segments_split_on_frame_boundaries_across_chunks():
+    segmenter = HlsSegmenter(segment_duration=FRAME_DURATION * 3, window_size=10)
+    stream = FRAME * 7
+    
+    for start in range(0, len(stream), 100):
+        segmenter.feed(stream[start:start + 100])
+    
+    assert [segment['sequence'] for segment in segmenter.segments] == [0, 1]
+    first = segmenter.get_segment(0)
+    assert first[get_id3v2_size(first):] == FRAME * 3
+    assert read_timestamp(segmenter.get_segment(1)) == int(FRAME_DURATION * 3 * 90000)
+    assert segmenter.current == bytearray(FRAME)
+
+
+def test_playlist_slides_with_the_window():
+    segmenter = HlsSegmenter(segment_duration=FRAME_DURATION, window_size=2)
+    segmenter.feed(FRAME * 4)
+    
+    playlist = segmenter.get_playlist().splitlines()
+    
+    assert playlist[:4] == ['#EXTM3U', '#EXT-X-VERSION:3', '#EXT-X-TARGETDURATION:1', '#EXT-X-MEDIA-SEQUENCE:2']
+    assert playlist[4:] == [f"#EXTINF:{FRAME_DURATION:.3f},", 'segment_2.mp3', f"#EXTINF:{FRAME_DURATION:.3f},", 'segment_3.mp3']
+    assert segmenter.get_segment(1) is None
+    assert segmenter.get_segment(4) is None
@@ -0,0 +1,132 @@
+import asyncio
+import base64
+from app.streaming.icecast_streamer import IcecastStreamer
+
+
+class MockIcecastServer:
+    def __init__(self, close_first_connection: bool = False):
+        self.close_first_connection = close_first_connection
+        self.handshakes = []
+        self.received = []
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        handshake = await reader.readuntil(b'\r\n\r\n')
+        self.handshakes.append(handshake.decode('utf-8'))
+        writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+        await writer.drain()
+
+        if self.close_first_connection and len(self.handshakes) == 1:
+            writer.close()
+            return
+
+        body = bytearray()
+        self.received.append(body)
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                break
+            body.extend(data)
+        writer.close()
+
+
+def create_streamer(port: int, **overrides) -> IcecastStreamer:
+    streamer = IcecastStreamer({'host': '127.0.0.1', 'port': port, 'password': 'hackme', 'mount': '/radio.mp3'})
+    for key, value in overrides.items():
+        setattr(streamer, key, value)
+    return streamer
+
+
+async def wait_for(condition, timeout: float = 5, tick=None):
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError('Condition not met in time')
+        if tick:
+            tick()
+        await asyncio.sleep(0.01)
+
+
+def test_handshake_and_streaming():
+    async def run():
+        server = MockIcecastServer()
+        await server.start()
+        streamer = create_streamer(server.port)
+
+        streamer.write(b'audio')
+        await wait_for(lambda: server.received and bytes(server.received[0]) == b'audio')
+
+        request_line, *headers = server.handshakes[0].split('\r\n')
+        assert request_line == 'PUT /radio.mp3 HTTP/1.1'
+        assert f"Authorization: Basic {base64.b64encode(b'source:hackme').decode('ascii')}" in headers
+        assert 'Expect: 100-continue' in headers
+        assert streamer.get_status()['connected']
+
+        streamer.disconnect()
+        await server.stop()
+
+    asyncio.run(run())
+
+
+def test_buffer_drops_oldest_chunks_when_full():
+    streamer = create_streamer(0, max_buffer_size=10)
+
+    for chunk in (b'aaaa', b'bbbb', b'cccc', b'dddd'):
+        streamer.add_to_buffer(chunk)
+
+    assert list(streamer.buffer) == [b'cccc', b'dddd']
+    assert streamer.buffer_size == 8
+    assert streamer.dropped_bytes == 8
+
+
+def test_reconnect_resumes_with_trimmed_backlog():
+    async def run():
+        server = MockIcecastServer(close_first_connection=True)
+        await server.start()
+        streamer = create_streamer(server.port, reconnect_delay=0.2, reconnect_backlog_size=8)
+
+        streamer.write(b'first')
+        await wait_for(lambda: len(server.handshakes) == 1)
+        await wait_for(lambda: streamer.reconnect_attempts == 1, tick=lambda: streamer.write(b'x' * 4))
+
+        for _ in range(10):
+            streamer.add_to_buffer(b'stale!')
+
+        await wait_for(lambda: len(server.handshakes) == 2)
+        await wait_for(lambda: server.received and len(server.received[0]) > 0)
+        await asyncio.sleep(0.05)
+
+        assert streamer.reconnect_attempts == 0
+        assert len(server.received[0]) <= 8
+
+        streamer.disconnect()
+        await server.stop()
+
+    asyncio.run(run())
+
+
+def test_reconnect_attempts_reset_after_cooldown():
+    async def run():
+        server = MockIcecastServer()
+        await server.start()
+        port = server.port
+        await server.stop()
+
+        streamer = create_streamer(port, reconnect_delay=0.01, max_reconnect_attempts=1, reconnect_cooldown=0.1)
+        streamer.write(b'audio')
+
+        await wait_for(lambda: streamer.reconnect_attempts == 1)
+        await wait_for(lambda: streamer.reconnect_attempts == 0)
+        assert not streamer.is_connected
+
+    asyncio.run(run())
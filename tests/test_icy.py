@@ -0,0 +1,32 @@
+from app.streaming.icy import IcyMetadataInjector, build_metadata_block
+
+
+def parse_stream_title(block: bytes) -> str:
+    text = block[1:block[0] * 16 + 1].rstrip(b'\x00').decode('utf-8')
+    assert text.startswith("StreamTitle='") and text.endswith("';")
+    return text[len("StreamTitle='"):-2]
+
+
+def test_quotes_and_semicolons_do_not_end_the_title():
+    block = build_metadata_block("Don't Stop; Believin'")
+    
+    title = parse_stream_title(block)
+    assert "'" not in title and ';' not in title
+    assert title == "Don’t Stop, Believin’"
+    assert (len(block) - 1) % 16 == 0
+
+
+def test_long_title_keeps_closing_delimiter():
+    block = build_metadata_block('é' * 3000)
+    
+    assert len(block) - 1 == block[0] * 16
+    assert parse_stream_title(block) == 'é' * 2000
+
+
+def test_injector_places_block_every_metaint_bytes():
+    block = build_metadata_block("Don't Stop")
+    injector = IcyMetadataInjector(lambda: block, metaint=4)
+    
+    output = injector.inject(b'abcdefgh')
+    
+    assert output == b'abcd' + block + b'efgh' + b'\x00'
@@ -0,0 +1,75 @@
+from app.streaming.mp3_frames import (
+    FrameIndex, Mp3FrameReader, find_frame, get_id3v2_size, parse_frame_header, split_frames
+)
+
+FRAME_HEADER = b'\xff\xfb\x90\x00'
+FRAME_LENGTH = 417
+FRAME_DURATION = 1152 / 44100
+
+
+def build_frame(fill: int = 0) -> bytes:
+    return FRAME_HEADER + bytes([fill]) * (FRAME_LENGTH - 4)
+
+
+def build_id3_tag(size: int) -> bytes:
+    return b'ID3\x04\x00\x00' + bytes([0, 0, size >> 7, size & 0x7F]) + b'\x00' * size
+
+
+def test_parse_frame_header():
+    header = parse_frame_header(FRAME_HEADER)
+    
+    assert header['length'] == FRAME_LENGTH
+    assert header['bitrate'] == 128000
+    assert header['sampleRate'] == 44100
+    assert header['duration'] == FRAME_DURATION
+    assert parse_frame_header(b'\xff\xfb\xf0\x00') is None
+    assert parse_frame_header(b'ID3\x04') is None
+
+
+def test_find_frame_skips_false_sync():
+    data = b'\xff\xfb\x90' + b'junk' + build_frame() + build_frame()
+    
+    assert find_frame(data, 0) == 7
+
+
+def test_split_frames_keeps_partial_tail():
+    data = build_frame(1) + build_frame(2)[:100]
+    
+    frames, remainder = split_frames(data)
+    
+    assert frames == [(build_frame(1), FRAME_DURATION)]
+    assert remainder == build_frame(2)[:100]
+    frames, remainder = split_frames(remainder + build_frame(2)[100:])
+    assert frames == [(build_frame(2), FRAME_DURATION)] and remainder == b''
+
+
+def test_index_skips_id3_tag_and_round_trips(tmp_path):
+    tag = build_id3_tag(200)
+    file_path = tmp_path / 'track.mp3'
+    file_path.write_bytes(tag + b''.join(build_frame(i) for i in range(5)))
+    
+    assert get_id3v2_size(tag) == len(tag)
+    
+    index = FrameIndex.load_or_build(str(file_path))
+    assert list(index.offsets) == [len(tag) + i * FRAME_LENGTH for i in range(5)]
+    assert index.end_offset == len(tag) + 5 * FRAME_LENGTH
+    
+    loaded = FrameIndex.load(FrameIndex.get_index_path(str(file_path)))
+    assert list(loaded.offsets) == list(index.offsets)
+    assert loaded.frame_duration == index.frame_duration
+
+
+def test_reader_seeks_to_frame_boundary(tmp_path):
+    file_path = tmp_path / 'track.mp3'
+    file_path.write_bytes(b''.join(build_frame(i) for i in range(10)))
+    index = FrameIndex.build(str(file_path))
+    reader = Mp3FrameReader(str(file_path), index)
+    
+    reader.seek(FRAME_DURATION * 7.5)
+    chunk, duration = reader.read(FRAME_DURATION * 2)
+    
+    assert chunk == build_frame(7) + build_frame(8)
+    assert duration == FRAME_DURATION * 2
+    assert reader.read(FRAME_DURATION * 5) == (build_frame(9), FRAME_DURATION)
+    assert reader.read(FRAME_DURATION) == (b'', 0.0)
+    reader.close()
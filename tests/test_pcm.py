@@ -0,0 +1,19 @@
+import numpy as np
+from app.streaming import pcm
+
+
+def frames(*values: int) -> bytes:
+    return np.repeat(np.array(values, dtype='<i2'), pcm.CHANNELS).tobytes()
+
+
+def test_gain_ramp_scales_each_frame_on_both_channels():
+    ramped = np.frombuffer(pcm.apply_gain_ramp(frames(1000, 1000, 1000, 1000), 0.0, 1.0), dtype='<i2')
+    
+    assert ramped.tolist() == [0, 0, 250, 250, 500, 500, 750, 750]
+    assert pcm.apply_gain_ramp(frames(1000), 1.0, 1.0) == frames(1000)
+
+
+def test_mix_clips_and_pads_the_shorter_input():
+    mixed = np.frombuffer(pcm.mix(frames(30000, -30000, 5), frames(10000, -10000)), dtype='<i2')
+    
+    assert mixed.tolist() == [32767, 32767, -32768, -32768, 5, 5]
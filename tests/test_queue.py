@@ -0,0 +1,101 @@
+import asyncio
+from app.streaming.queue import Queue
+from app.streaming.track_list import TrackRecord
+
+
+def create_queue(refill_started: asyncio.Event, refill_release: asyncio.Event) -> Queue:
+    station_queue = Queue()
+    station_queue.mixer = None
+    station_queue.min_queue_size = 2
+    
+    async def ensure_queue_size():
+        refill_started.set()
+        await refill_release.wait()
+        station_queue.track_list.add(TrackRecord('refilled.mp3', title='Refilled'))
+    
+    async def stream_audio():
+        pass
+    
+    station_queue.ensure_queue_size = ensure_queue_size
+    station_queue.stream_audio = stream_audio
+    return station_queue
+
+
+def test_play_advances_without_waiting_for_refill():
+    async def run():
+        refill_started = asyncio.Event()
+        refill_release = asyncio.Event()
+        station_queue = create_queue(refill_started, refill_release)
+        station_queue.track_list.add(TrackRecord('first.mp3', title='First'))
+        
+        await asyncio.wait_for(station_queue.play(), 1)
+        
+        assert station_queue.current_track.title == 'First'
+        await asyncio.wait_for(refill_started.wait(), 1)
+        assert not station_queue.refill_task.done()
+        
+        refill_release.set()
+        await station_queue.refill_task
+        assert station_queue.track_list.get_upcoming().title == 'Refilled'
+    
+    asyncio.run(run())
+
+
+def test_play_waits_for_refill_when_nothing_is_queued():
+    async def run():
+        refill_started = asyncio.Event()
+        refill_release = asyncio.Event()
+        station_queue = create_queue(refill_started, refill_release)
+        
+        play_task = asyncio.create_task(station_queue.play())
+        await asyncio.wait_for(refill_started.wait(), 1)
+        assert not play_task.done()
+        
+        refill_release.set()
+        await asyncio.wait_for(play_task, 1)
+        assert station_queue.current_track.title == 'Refilled'
+    
+    asyncio.run(run())
+
+
+def test_retire_track_moves_only_downloaded_tracks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tracks_dir = tmp_path / 'media' / 'tracks'
+    tracks_dir.mkdir(parents=True)
+    (tracks_dir / 'Seed.mp3').write_bytes(b'seed')
+    (tracks_dir / 'Download.mp3').write_bytes(b'download')
+    
+    async def run():
+        station_queue = Queue()
+        seed = TrackRecord('media/tracks/Seed.mp3', title='Seed')
+        download = TrackRecord('media/tracks/Download.mp3', title='Download', downloaded=True)
+        
+        await station_queue.retire_track(seed)
+        await station_queue.retire_track(download)
+        
+        assert seed.url == 'media/tracks/Seed.mp3'
+        assert (tracks_dir / 'Seed.mp3').exists()
+        assert download.url == 'cache/Download.mp3'
+        assert not (tracks_dir / 'Download.mp3').exists()
+        assert (tmp_path / 'cache' / 'Download.mp3').read_bytes() == b'download'
+    
+    asyncio.run(run())
+
+
+def test_refill_indexes_upcoming_tracks_before_they_play(tmp_path):
+    frame = b'\xff\xfb\x90\x00' + b'\x00' * 413
+    track_path = tmp_path / 'seed.mp3'
+    track_path.write_bytes(frame * 10)
+    
+    async def run():
+        station_queue = Queue()
+        station_queue.min_queue_size = 1
+        station_queue.track_list.add(TrackRecord(str(track_path), title='Seed'))
+        
+        await station_queue.ensure_queue_size()
+        
+        index = station_queue.track_list.get_upcoming().index
+        assert index.frame_count == 10
+        assert index.end_offset == len(frame) * 10
+    
+    asyncio.run(run())
@@ -0,0 +1,81 @@
+import random
+from collections import Counter
+from app.managers.default_playlist_index import DefaultPlaylistIndex
+from app.services import rotation_engine as rotation_module
+from app.services.rotation_engine import RotationEngine
+
+
+def build_entries(playlist_id: str, count: int) -> list:
+    return [{'playlistId': playlist_id, 'title': f"{playlist_id}-{i}", 'url': f"{playlist_id}-{i}"} for i in range(count)]
+
+
+def create_index(monkeypatch, playlists: list, entries: list) -> DefaultPlaylistIndex:
+    index = DefaultPlaylistIndex()
+    index.loaded = True
+    index.playlists = index.group_playlists(playlists)
+    index.entries_by_playlist = index.group_entries(entries)
+    monkeypatch.setattr(rotation_module, 'default_playlist_index', index)
+    return index
+
+
+def test_shuffle_bag_plays_every_track_before_repeating(monkeypatch):
+    random.seed(1)
+    create_index(monkeypatch, [{'playlistId': 'a', 'genre': 'mix', 'isActive': True}], build_entries('a', 10))
+    engine = RotationEngine(no_repeat_window=4, lookahead=0)
+    
+    first_pass = [engine.next('mix')['url'] for _ in range(10)]
+    
+    assert sorted(first_pass) == sorted(f"a-{i}" for i in range(10))
+    second_pass = [engine.next('mix')['url'] for _ in range(10)]
+    assert sorted(second_pass) == sorted(first_pass)
+
+
+def test_no_repeat_window_holds_across_bag_refills(monkeypatch):
+    random.seed(2)
+    create_index(monkeypatch, [{'playlistId': 'a', 'genre': 'mix', 'isActive': True}], build_entries('a', 8))
+    engine = RotationEngine(no_repeat_window=3, lookahead=0)
+    
+    played = [engine.next('mix')['url'] for _ in range(200)]
+    
+    for position in range(3, len(played)):
+        assert played[position] not in played[position - 3:position]
+
+
+def test_playlists_are_drawn_in_proportion_to_weight(monkeypatch):
+    random.seed(3)
+    create_index(
+        monkeypatch,
+        [
+            {'playlistId': 'light', 'genre': 'mix', 'isActive': True, 'weight': 1},
+            {'playlistId': 'heavy', 'genre': 'mix', 'isActive': True, 'weight': 3}
+        ],
+        build_entries('light', 20) + build_entries('heavy', 20)
+    )
+    engine = RotationEngine(no_repeat_window=0, lookahead=0)
+    
+    counts = Counter(engine.next('mix')['playlistId'] for _ in range(4000))
+    
+    assert 2.5 < counts['heavy'] / counts['light'] < 3.5
+
+
+def test_sync_keeps_bags_of_unchanged_playlists(monkeypatch):
+    random.seed(4)
+    index = create_index(
+        monkeypatch,
+        [
+            {'playlistId': 'a', 'genre': 'mix', 'isActive': True},
+            {'playlistId': 'b', 'genre': 'mix', 'isActive': True}
+        ],
+        build_entries('a', 5) + build_entries('b', 5)
+    )
+    engine = RotationEngine(no_repeat_window=0, lookahead=0)
+    engine.sync('mix')
+    bag = engine.get_bag('a')
+    engine.get_bag('b')
+    
+    index.set_metadata(build_entries('a', 5) + build_entries('b', 6))
+    engine.sync('mix')
+    
+    assert engine.bags.get('a') is bag
+    assert 'b' not in engine.bags
+    assert len(engine.entries_by_playlist['b']) == 6
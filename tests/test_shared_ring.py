@@ -0,0 +1,79 @@
+import pytest
+from app.streaming.shared_ring import SharedRingBuffer
+
+FRAME = b'\xff\xfb\x90\x00' + b'\x00' * 413
+
+
+def test_reader_sees_writes_across_the_wrap(tmp_path):
+    path = str(tmp_path / 'ring')
+    writer = SharedRingBuffer.create(path, capacity=16)
+    reader = SharedRingBuffer.open(path)
+    
+    writer.write(b'0123456789')
+    data, position = reader.read(0)
+    assert (data, position) == (b'0123456789', 10)
+    
+    writer.write(b'abcdefghij')
+    data, position = reader.read(position)
+    assert (data, position) == (b'abcdefghij', 20)
+    assert reader.read(position) == (b'', 20)
+    
+    writer.close()
+    reader.close()
+
+
+def test_lapped_reader_is_told_to_resync(tmp_path):
+    ring = SharedRingBuffer.create(str(tmp_path / 'ring'), capacity=16)
+    
+    ring.write(b'x' * 10)
+    ring.write(b'y' * 10)
+    
+    assert ring.read(0) == (None, 0)
+    assert ring.read(4, limit=6) == (b'x' * 6, 10)
+    ring.close()
+
+
+def test_oversized_write_keeps_the_newest_bytes(tmp_path):
+    ring = SharedRingBuffer.create(str(tmp_path / 'ring'), capacity=8)
+    
+    ring.write(b'0123456789ab')
+    
+    assert ring.write_position == 12
+    assert ring.read(4) == (b'456789ab', 12)
+    ring.close()
+
+
+def test_live_position_starts_on_a_frame(tmp_path):
+    ring = SharedRingBuffer.create(str(tmp_path / 'ring'), capacity=4096)
+    ring.write(b'\x00' * 50 + FRAME * 3)
+    
+    position = ring.live_position(backlog=len(FRAME) * 2 + 10)
+    
+    assert position == 50 + len(FRAME)
+    assert ring.read(position, limit=4)[0] == FRAME[:4]
+    ring.close()
+
+
+def test_metadata_is_shared_and_cached_by_version(tmp_path):
+    path = str(tmp_path / 'ring')
+    writer = SharedRingBuffer.create(path, capacity=16)
+    reader = SharedRingBuffer.open(path)
+    
+    writer.set_metadata(b'\x01first')
+    first = reader.get_metadata()
+    assert first == b'\x01first'
+    assert reader.get_metadata() is first
+    
+    writer.set_metadata(b'\x01second')
+    assert reader.get_metadata() == b'\x01second'
+    
+    writer.close()
+    reader.close()
+
+
+def test_open_rejects_foreign_files(tmp_path):
+    path = tmp_path / 'not-a-ring'
+    path.write_bytes(b'\x00' * 8192)
+    
+    with pytest.raises(ValueError):
+        SharedRingBuffer.open(str(path))
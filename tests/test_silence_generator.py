@@ -0,0 +1,25 @@
+from app.streaming.mp3_frames import split_frames
+from app.streaming.silence_generator import SilenceGenerator
+
+
+def test_silence_is_a_run_of_valid_frames():
+    generator = SilenceGenerator()
+    
+    chunk, duration = generator.get_silence(0.5)
+    frames, remainder = split_frames(chunk)
+    
+    assert remainder == b''
+    assert len(frames) == int(0.5 / generator.frame_duration)
+    assert all(frame == generator.silence_frame for frame, _ in frames)
+    assert duration == len(frames) * generator.frame_duration
+
+
+def test_silence_buffers_are_reused():
+    generator = SilenceGenerator()
+    
+    first, _ = generator.get_silence(0.2)
+    second, _ = generator.get_silence(0.2)
+    
+    assert first is second
+    assert generator.get_silence(0)[1] == generator.frame_duration
+
@@ -0,0 +1,20 @@
+from fastapi.testclient import TestClient
+import main
+from app.core.constants import DEFAULT_STATION_ID
+from app.streaming.icecast_streamer import IcecastStreamer
+from app.streaming.queue import Queue
+from app.streaming.station_manager import Station
+
+
+def test_icecast_status_is_reported_per_station(monkeypatch):
+    jazz_queue = Queue()
+    jazz_queue.icecast_streamers.append(IcecastStreamer({'host': 'icecast.local', 'port': 8000, 'password': 'hackme', 'mount': '/jazz.mp3'}))
+    jazz_queue.use_icecast = True
+    monkeypatch.setitem(main.station_manager.stations, 'jazz', Station('jazz', jazz_queue))
+    client = TestClient(main.app)
+    
+    jazz_status = client.get('/api/stations/jazz/icecast/status').json()
+    
+    assert jazz_status['enabled'] and jazz_status['config']['mount'] == '/jazz.mp3'
+    assert client.get(f"/api/stations/{DEFAULT_STATION_ID}/icecast/status").json() == client.get('/api/icecast/status').json()
+    assert client.get('/api/stations/missing/icecast/status').status_code == 404
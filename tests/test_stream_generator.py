@@ -0,0 +1,24 @@
+import asyncio
+from io import BytesIO
+import main
+
+
+class ConnectedQueue:
+    def has_client(self, client_id):
+        return True
+
+
+def test_write_during_yield_is_not_lost():
+    async def run():
+        client_buffer = BytesIO()
+        client_buffer.write(b'first')
+        generator = main.stream_generator(ConnectedQueue(), 'client', client_buffer)
+        
+        assert await generator.__anext__() == b'first'
+        client_buffer.write(b'second')
+        assert await asyncio.wait_for(generator.__anext__(), 1) == b'second'
+        assert client_buffer.tell() == 0
+        
+        await generator.aclose()
+    
+    asyncio.run(run())